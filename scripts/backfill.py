@@ -0,0 +1,52 @@
+import click
+import sqlite3
+from pytezos import pytezos
+from scripts.environment import load_or_ask
+from tests.helpers.backfill import backfill
+from tests.helpers.indexer import GovernanceIndexer
+from typing import Optional
+
+
+@click.command()
+@click.option('--contract-address', required=True, help='The governance contract address')
+@click.option('--kind', type=click.Choice(['kernel', 'sequencer']), default='kernel', help='The kind of the governance contract')
+@click.option('--start-level', required=True, type=int, help='The first level to index, usually the contract origination level')
+@click.option('--end-level', default=None, type=int, help='The last level to index. The head minus 2 confirmations by default')
+@click.option('--database', default='governance.sqlite', help='The SQLite database file')
+@click.option('--workers', default=8, help='The number of blocks fetched concurrently')
+@click.option('--chunk-size', default=100, help='The number of levels committed together with a checkpoint')
+@click.option('--rpc-url', default=None, help='Tezos RPC URL.')
+def backfill_governance(
+    contract_address: str,
+    kind: str,
+    start_level: int,
+    end_level: Optional[int],
+    database: str,
+    workers: int,
+    chunk_size: int,
+    rpc_url: Optional[str],
+):
+    """Indexes the history of the governance contract in parallel and prints the state of every period.
+    Resumes from the last checkpoint stored in the database"""
+
+    rpc_url = rpc_url or load_or_ask('RPC_URL')
+    client = pytezos.using(shell=rpc_url)
+    end_level = end_level or int(client.shell.head.header()['level']) - 2
+    indexer = GovernanceIndexer(sqlite3.connect(database), contract_address, kind)
+
+    def print_progress(level: int, blocks_per_second: float):
+        print(f'indexed up to level {level} of {end_level}, {blocks_per_second:.1f} blocks/s')
+
+    operations_count = backfill(indexer, client, start_level, end_level, workers, chunk_size, print_progress)
+    print(f'found {operations_count} governance operations')
+
+    print('')
+    for state in indexer.get_period_states():
+        print(f'period {state.period_index} ({state.period_type}), total voting power: {state.total_voting_power}')
+        for payload, voting_power in state.upvotes.items():
+            print(f'    upvotes: {payload} {voting_power}')
+        for ballot, voting_power in state.ballots.items():
+            print(f'    ballots: {ballot} {voting_power}')
+        if state.finished_voting is not None:
+            finished_at_period_type, winner_payload = state.finished_voting
+            print(f'    finished as {finished_at_period_type}, winner: {winner_payload}')
@@ -0,0 +1,58 @@
+import click
+import sqlite3
+import time
+from pytezos import pytezos
+from scripts.environment import load_or_ask
+from tests.helpers.indexer import GovernanceIndexer
+from typing import Optional
+
+
+@click.command()
+@click.option('--contract-address', required=True, help='The governance contract address')
+@click.option('--kind', type=click.Choice(['kernel', 'sequencer']), default='kernel', help='The kind of the governance contract')
+@click.option('--start-level', required=True, type=int, help='The first level to index')
+@click.option('--end-level', default=None, type=int, help='The last level to index. The head by default')
+@click.option('--database', default=':memory:', help='The SQLite database file')
+@click.option('--queries', default=1000, help='The number of times each query is run')
+@click.option('--rpc-url', default=None, help='Tezos RPC URL.')
+def benchmark_indexer(
+    contract_address: str,
+    kind: str,
+    start_level: int,
+    end_level: Optional[int],
+    database: str,
+    queries: int,
+    rpc_url: Optional[str],
+):
+    """Measures the ingestion throughput and the query latency of the governance indexer"""
+
+    rpc_url = rpc_url or load_or_ask('RPC_URL')
+    client = pytezos.using(shell=rpc_url)
+    end_level = end_level or int(client.shell.head.header()['level'])
+    indexer = GovernanceIndexer(sqlite3.connect(database), contract_address, kind)
+
+    # NOTE: the blocks are fetched with their governance context before indexing, so only the ingestion itself is measured
+    started_at = time.perf_counter()
+    blocks = [indexer.fetch_block(client, level) for level in range(start_level, end_level + 1)]
+    fetching_time = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    operations_count = sum(indexer.index_block(block) for block in blocks)
+    ingestion_time = time.perf_counter() - started_at
+
+    print(f'fetched {len(blocks)} blocks in {fetching_time:.3f} s')
+    print(f'indexed {operations_count} operations of {len(blocks)} blocks in {ingestion_time:.3f} s: '
+        f'{len(blocks) / ingestion_time:.0f} blocks/s, {operations_count / ingestion_time:.0f} operations/s')
+
+    period_indexes = [row[0] for row in indexer.connection.execute('SELECT DISTINCT period_index FROM periods')] or [0]
+    benchmarked_queries = {
+        'get_proposals': lambda index: indexer.get_proposals(period_indexes[index % len(period_indexes)]),
+        'get_ballots_summary': lambda index: indexer.get_ballots_summary(period_indexes[index % len(period_indexes)]),
+        'get_winners': lambda _: indexer.get_winners(),
+    }
+    for name, query in benchmarked_queries.items():
+        started_at = time.perf_counter()
+        for index in range(queries):
+            query(index)
+        elapsed = time.perf_counter() - started_at
+        print(f'{name:>20}: {elapsed / queries * 1e6:.1f} us/query')
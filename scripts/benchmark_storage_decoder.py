@@ -0,0 +1,122 @@
+import click
+import time
+import tracemalloc
+from os.path import join
+from pytezos import ContractInterface
+from scripts.contract_type import ContractType
+from scripts.metadata import contract_filename_by_contract_type
+from tests.helpers.storage import (
+    decode_kernel_governance_storage,
+    decode_sequencer_governance_storage,
+)
+from tests.helpers.utility import assert_build_is_fresh, get_build_dir
+from typing import Any, Callable
+
+
+decoder_by_contract_type = {
+    ContractType.kernel_regular_governance: decode_kernel_governance_storage,
+    ContractType.kernel_security_governance: decode_kernel_governance_storage,
+    ContractType.sequencer_governance: decode_sequencer_governance_storage,
+}
+
+SEQUENCER_PK = 'edpkuBknW28nW72KG6RoHtYW7p12T6GKc7nAbwYX5m8Wd9sDVC9yav'
+
+
+def make_payload(contract_type: ContractType, index: int) -> Any:
+    if contract_type == ContractType.sequencer_governance:
+        return {
+            'sequencer_pk': SEQUENCER_PK,
+            'pool_address': index.to_bytes(20, 'big'),
+        }
+    return index.to_bytes(33, 'big')
+
+
+def make_storage_snapshot(contract_type: ContractType, index: int) -> dict[str, Any]:
+    """Makes a storage with a voting context and a last winner that vary by index"""
+
+    payload = make_payload(contract_type, index)
+    if index % 2 == 0:
+        period = {'proposal': {
+            'max_upvotes_voting_power': index if index % 4 == 0 else None,
+            'winner_candidate': payload if index % 4 == 0 else None,
+            'total_voting_power': 20000000000000,
+        }}
+    else:
+        period = {'promotion': {
+            'yea_voting_power': index * 3,
+            'nay_voting_power': index * 2,
+            'pass_voting_power': index,
+            'total_voting_power': 20000000000000,
+            'winner_candidate': payload,
+        }}
+
+    return {
+        'config': {
+            'started_at_level': index,
+            'period_length': 10,
+            'adoption_period_sec': 60,
+            'upvoting_limit': 20,
+            'scale': 100,
+            'proposal_quorum': 80,
+            'promotion_quorum': 80,
+            'promotion_supermajority': 80,
+        },
+        'voting_context': {'period_index': index, 'period': period},
+        'last_winner': {
+            'payload': payload,
+            'trigger_history': index + 1,
+            'payload_prefix': None,
+        } if index % 3 == 0 else None,
+        'proposals': index + 2,
+        'upvoters_proposals': index + 3,
+        'payloads': index + 4,
+        'voters': index + 5,
+        'metadata': index + 6,
+    }
+
+
+def measure(decode: Callable[[Any], Any], snapshots: list) -> tuple[float, int]:
+    """Returns the decoding time and the memory retained by the decoded snapshots"""
+
+    started_at = time.perf_counter()
+    for snapshot in snapshots:
+        decode(snapshot)
+    elapsed = time.perf_counter() - started_at
+
+    # NOTE: memory is traced in a separate pass since tracing slows the decoding down
+    tracemalloc.start()
+    decoded = [decode(snapshot) for snapshot in snapshots]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del decoded
+    return elapsed, retained
+
+
+@click.command()
+@click.option(
+    '--contract',
+    default=ContractType.kernel_regular_governance.name,
+    help='"kernel_regular_governance", "kernel_security_governance" or "sequencer_governance"',
+)
+@click.option('--snapshots', default=5000, help='The number of storage snapshots to decode')
+def benchmark_storage_decoder(contract: str, snapshots: int):
+    """Compares the typed storage decoder with pytezos storage conversion"""
+
+    contract_type = ContractType[contract]
+    # NOTE: the storage type is taken from the build, a stale build can't encode the current storage layout
+    assert_build_is_fresh()
+    filename = join(get_build_dir(), contract_filename_by_contract_type[contract_type])
+    storage_type = ContractInterface.from_file(filename).program.storage
+    micheline_snapshots = [
+        storage_type.from_python_object(make_storage_snapshot(contract_type, index)).to_micheline_value()
+        for index in range(snapshots)
+    ]
+
+    results = {
+        'typed decoder': measure(decoder_by_contract_type[contract_type], micheline_snapshots),
+        'pytezos': measure(lambda snapshot: storage_type.from_micheline_value(snapshot).to_python_object(), micheline_snapshots),
+    }
+
+    print(f'decoded {snapshots} {contract_type.name} storage snapshots')
+    for name, (elapsed, retained) in results.items():
+        print(f'{name:>14}: {elapsed:.3f} s, {elapsed / snapshots * 1e6:.1f} us/snapshot, {retained / snapshots:.0f} bytes/snapshot')
@@ -0,0 +1,48 @@
+import click
+from pytezos import pytezos
+from scripts.environment import load_or_ask
+from tests.helpers.big_map_reader import BigMapReader
+from tests.helpers.storage import (
+    decode_kernel_governance_storage,
+    decode_kernel_payload,
+    decode_sequencer_governance_storage,
+    decode_sequencer_payload,
+)
+from typing import Optional
+
+
+@click.command()
+@click.option('--contract-address', required=True, help='The governance contract address')
+@click.option('--kind', type=click.Choice(['kernel', 'sequencer']), default='kernel', help='The kind of the governance contract')
+@click.option('--period-index', required=True, type=int, help='The period to read the entries of')
+@click.option('--workers', default=8, help='The number of concurrent requests')
+@click.option('--rpc-url', default=None, help='Tezos RPC URL.')
+def read_big_maps(
+    contract_address: str,
+    kind: str,
+    period_index: int,
+    workers: int,
+    rpc_url: Optional[str],
+):
+    """Prints the proposals, upvoters, voters and payloads big_map entries of the period.
+    The keys are listed from the raw context of the node"""
+
+    rpc_url = rpc_url or load_or_ask('RPC_URL')
+    client = pytezos.using(shell=rpc_url)
+    raw_storage = client.shell.head.context.contracts[contract_address].storage()
+    if kind == 'kernel':
+        storage, decode_payload = decode_kernel_governance_storage(raw_storage), decode_kernel_payload
+    else:
+        storage, decode_payload = decode_sequencer_governance_storage(raw_storage), decode_sequencer_payload
+
+    reader = BigMapReader(client, storage, workers)
+    period = reader.read_period(period_index, decode_payload)
+    print(f'period {period_index}')
+    for proposal_key, proposal in period.proposals.items():
+        print(f'    proposal: {proposal_key.hex()} by {proposal.proposer}, upvotes voting power: {proposal.upvotes_voting_power}')
+    for upvoter, proposal_keys in period.upvoters_proposals.items():
+        print(f'    upvoter: {upvoter} {sorted(proposal_key.hex() for proposal_key in proposal_keys)}')
+    for voter, ballot in period.ballots.items():
+        print(f'    ballot: {voter} {ballot}')
+    for proposal_key, payload in period.payloads.items():
+        print(f'    payload: {proposal_key.hex()} {payload}')
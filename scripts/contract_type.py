@@ -1,3 +1,3 @@
 from enum import Enum
 
-ContractType = Enum('ContractType', ['kernel_regular_governance', 'kernel_security_governance', 'sequencer_governance'])
+ContractType = Enum('ContractType', ['kernel_regular_governance', 'kernel_security_governance', 'sequencer_governance', 'kernel_multi_track_governance'])
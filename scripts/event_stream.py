@@ -0,0 +1,37 @@
+import asyncio
+import click
+from datetime import datetime, timezone
+from pytezos import pytezos
+from scripts.environment import load_or_ask
+from tests.helpers.event_stream import Rollback, stream_governance_events
+from typing import Optional
+
+
+async def print_events(client, contract_address: str) -> None:
+    latencies = []
+    try:
+        async for item in stream_governance_events(client, contract_address):
+            if isinstance(item, Rollback):
+                print(f'rollback of the events from level {item.level}')
+                continue
+            # NOTE: the block timestamp is the earliest time the operation could be included at
+            latency = (datetime.now(timezone.utc) - item.block_timestamp).total_seconds()
+            latencies.append(latency)
+            print(f'level {item.level} {item.kind}: {item.data}, latency {latency:.2f} s')
+    finally:
+        if latencies:
+            print(f'delivered {len(latencies)} events, latency avg {sum(latencies) / len(latencies):.2f} s, max {max(latencies):.2f} s')
+
+
+@click.command()
+@click.option('--contract-address', required=True, help='The governance contract address')
+@click.option('--rpc-url', default=None, help='Tezos RPC URL.')
+def stream_events(contract_address: str, rpc_url: Optional[str]):
+    """Prints the governance events of the new blocks with the latency from the block timestamp"""
+
+    rpc_url = rpc_url or load_or_ask('RPC_URL')
+    client = pytezos.using(shell=rpc_url)
+    try:
+        asyncio.run(print_events(client, contract_address))
+    except KeyboardInterrupt:
+        pass
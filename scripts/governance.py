@@ -3,18 +3,19 @@ from pytezos import pytezos, PyTezosClient
 from scripts.contract_type import ContractType
 from tests.helpers.contracts.sequencer_governance import SequencerGovernance
 from tests.helpers.contracts.kernel_governance import KernelGovernance
+from tests.helpers.contracts.multi_track_kernel_governance import MultiTrackKernelGovernance, REGULAR_TRACK, SECURITY_TRACK
 from typing import Optional
 import click
 from scripts.environment import load_or_ask
 from tests.helpers.metadata import Metadata
 from tests.helpers.utility import normalize_params, validate_percent_value
-from scripts.metadata import metadata_by_contract_type
+from scripts.metadata import make_metadata
 
 @click.command()
 @click.option(
     '--contract',
     required=True,
-    help='"kernel_governance" or "sequencer_governance"',
+    help='"kernel_regular_governance", "kernel_security_governance", "sequencer_governance" or "kernel_multi_track_governance"',
 )
 @click.option(
     '--period_length',
@@ -46,6 +47,41 @@ from scripts.metadata import metadata_by_contract_type
     required=True,
     help='The min promotion_supermajority for the proposal be considered as a winner. Range: [0, 100]',
 )
+@click.option(
+    '--security_period_length',
+    default=None,
+    help='kernel_multi_track_governance only. The security track period_length',
+)
+@click.option(
+    '--security_adoption_period_sec',
+    default=None,
+    help='kernel_multi_track_governance only. The security track adoption_period_sec',
+)
+@click.option(
+    '--security_upvoting_limit',
+    default=None,
+    help='kernel_multi_track_governance only. The security track upvoting_limit',
+)
+@click.option(
+    '--security_proposal_quorum_percent',
+    default=None,
+    help='kernel_multi_track_governance only. The security track proposal_quorum_percent',
+)
+@click.option(
+    '--security_promotion_quorum_percent',
+    default=None,
+    help='kernel_multi_track_governance only. The security track promotion_quorum_percent',
+)
+@click.option(
+    '--security_promotion_supermajority_percent',
+    default=None,
+    help='kernel_multi_track_governance only. The security track promotion_supermajority_percent',
+)
+@click.option(
+    '--offchain_views/--no_offchain_views',
+    default=True,
+    help='Embed the contract views as TZIP-16 off-chain views in the contract metadata',
+)
 @click.option('--private-key', default=None, help='Use the provided private key.')
 @click.option('--rpc-url', default=None, help='Tezos RPC URL.')
 def deploy_contract(
@@ -56,22 +92,32 @@ def deploy_contract(
     proposal_quorum_percent: str,
     promotion_quorum_percent: str,
     promotion_supermajority_percent: str,
+    security_period_length: Optional[str],
+    security_adoption_period_sec: Optional[str],
+    security_upvoting_limit: Optional[str],
+    security_proposal_quorum_percent: Optional[str],
+    security_promotion_quorum_percent: Optional[str],
+    security_promotion_supermajority_percent: Optional[str],
+    offchain_views: bool,
     private_key: Optional[str],
     rpc_url: Optional[str],
 ) -> KernelGovernance:
     """Deploys a governance contract using provided key as a manager"""
 
     contract_type = ContractType[contract]
-    period_length = int(period_length)
-    adoption_period_sec = int(adoption_period_sec)
-    upvoting_limit = int(upvoting_limit)
-    proposal_quorum = float(proposal_quorum_percent)
-    promotion_quorum = float(promotion_quorum_percent)
-    promotion_supermajority = float(promotion_supermajority_percent)
-
-    validate_percent_value(proposal_quorum)
-    validate_percent_value(promotion_quorum)
-    validate_percent_value(promotion_supermajority)
+    security_params = [
+        security_period_length,
+        security_adoption_period_sec,
+        security_upvoting_limit,
+        security_proposal_quorum_percent,
+        security_promotion_quorum_percent,
+        security_promotion_supermajority_percent,
+    ]
+    if contract_type == ContractType.kernel_multi_track_governance:
+        if None in security_params:
+            raise click.UsageError('All the --security_* options are required for kernel_multi_track_governance')
+    elif security_params != [None] * len(security_params):
+        raise click.UsageError('The --security_* options are only used by kernel_multi_track_governance')
 
     private_key = private_key or load_or_ask('PRIVATE_KEY', is_secret=True)
     rpc_url = rpc_url or load_or_ask('RPC_URL')
@@ -84,39 +130,82 @@ def deploy_contract(
     print('')
     print('blockchain_info:', json.dumps(blockchain_info, indent=4))
 
-    if (protocol_voting_period_length % period_length) != 0: 
-        raise Exception(f'Period length is incorrect, it must be a divisor of the length of the Tezos protocol voting period length. protocol_period_length={protocol_voting_period_length}, period_length={period_length}') 
-
-    normalized_params = normalize_params([100, proposal_quorum, promotion_quorum, promotion_supermajority])
-    [scale, proposal_quorum, promotion_quorum, promotion_supermajority] = normalized_params
-    metadata = metadata_by_contract_type[contract_type]
-    
-    config = {
-        'started_at_level': protocol_voting_started_at_level,
-        'period_length': period_length,
-        'adoption_period_sec': adoption_period_sec,
-        'upvoting_limit': upvoting_limit,
-        'scale': scale,
-        'proposal_quorum': proposal_quorum,
-        'promotion_quorum': promotion_quorum,
-        'promotion_supermajority': promotion_supermajority,
-    }
+    metadata = make_metadata(contract_type, offchain_views)
+    config = make_config(
+        protocol_voting_started_at_level,
+        protocol_voting_period_length,
+        period_length,
+        adoption_period_sec,
+        upvoting_limit,
+        proposal_quorum_percent,
+        promotion_quorum_percent,
+        promotion_supermajority_percent,
+    )
+    security_config = None
+    if contract_type == ContractType.kernel_multi_track_governance:
+        security_config = make_config(
+            protocol_voting_started_at_level,
+            protocol_voting_period_length,
+            *security_params,
+        )
 
     print('')
     print('smart_contact_config:', json.dumps(config, indent=4))
+    if security_config is not None:
+        print('smart_contact_security_config:', json.dumps(security_config, indent=4))
 
     print('')
-    print('smart_contact_metadata:', json.dumps(metadata, indent=4))
+    metadata_without_views = {key: value for key, value in metadata.items() if key != 'views'}
+    print('smart_contact_metadata:', json.dumps(metadata_without_views, indent=4))
+    print('smart_contact_offchain_views:', [view['name'] for view in metadata.get('views', [])])
 
     print('')
     if not click.confirm('Do you want to originate the smart contract?', default=True):
         return 
 
-    opg = originate_contract(contract_type, manager, config, metadata)
+    opg = originate_contract(contract_type, manager, config, metadata, security_config)
     manager.wait(opg)
     kernelGovernance = KernelGovernance.from_opg(manager, opg)
     return kernelGovernance
 
+def make_config(
+    started_at_level: int,
+    protocol_voting_period_length: int,
+    period_length: str,
+    adoption_period_sec: str,
+    upvoting_limit: str,
+    proposal_quorum_percent: str,
+    promotion_quorum_percent: str,
+    promotion_supermajority_percent: str,
+) -> dict:
+    """Validates the voting params and makes the config of a governance contract or a track"""
+
+    period_length = int(period_length)
+    proposal_quorum = float(proposal_quorum_percent)
+    promotion_quorum = float(promotion_quorum_percent)
+    promotion_supermajority = float(promotion_supermajority_percent)
+
+    validate_percent_value(proposal_quorum)
+    validate_percent_value(promotion_quorum)
+    validate_percent_value(promotion_supermajority)
+
+    if (protocol_voting_period_length % period_length) != 0: 
+        raise Exception(f'Period length is incorrect, it must be a divisor of the length of the Tezos protocol voting period length. protocol_period_length={protocol_voting_period_length}, period_length={period_length}') 
+
+    normalized_params = normalize_params([100, proposal_quorum, promotion_quorum, promotion_supermajority])
+    [scale, proposal_quorum, promotion_quorum, promotion_supermajority] = normalized_params
+
+    return {
+        'started_at_level': started_at_level,
+        'period_length': period_length,
+        'adoption_period_sec': int(adoption_period_sec),
+        'upvoting_limit': int(upvoting_limit),
+        'scale': scale,
+        'proposal_quorum': proposal_quorum,
+        'promotion_quorum': promotion_quorum,
+        'promotion_supermajority': promotion_supermajority,
+    }
+
 def get_blockchain_info(manager: PyTezosClient) -> dict:
     info = manager.shell.head.metadata()
     current_level = int(info['level_info']['level'])
@@ -132,10 +221,27 @@ def get_blockchain_info(manager: PyTezosClient) -> dict:
         'protocol_voting_started_at_level': protocol_voting_started_at_level
     }
 
-def originate_contract(contract_type: ContractType, manager: PyTezosClient, config: dict, metadata: dict):
+def originate_contract(
+    contract_type: ContractType,
+    manager: PyTezosClient,
+    config: dict,
+    metadata: dict,
+    security_config: Optional[dict] = None,
+):
+    """Originates the contract of given type. The multi-track contract starts
+    the regular track with config and the security track with security_config"""
+
     if contract_type in [ContractType.kernel_regular_governance, ContractType.kernel_security_governance]:
         return KernelGovernance.originate(manager, config, metadata).send()
     elif contract_type == ContractType.sequencer_governance:
         return SequencerGovernance.originate(manager, config, metadata).send()
+    elif contract_type == ContractType.kernel_multi_track_governance:
+        if security_config is None:
+            raise ValueError("security_config is required for the multi-track contract")
+        custom_configs = {
+            REGULAR_TRACK: config,
+            SECURITY_TRACK: security_config,
+        }
+        return MultiTrackKernelGovernance.originate(manager, custom_configs, metadata).send()
     else:
         raise ValueError("Incorrect contract_type")
@@ -0,0 +1,34 @@
+import asyncio
+import click
+import json
+from tests.helpers.governance_monitor import GovernanceMonitor, MonitoredContract, render_table
+
+
+async def run_monitor(monitor: GovernanceMonitor, interval: float, once: bool) -> None:
+    while True:
+        rows = await monitor.refresh()
+        if not once:
+            click.clear()
+        print(render_table(rows, monitor.contracts))
+        if once:
+            return
+        await asyncio.sleep(interval)
+
+
+@click.command()
+@click.option('--contracts-file', required=True, type=click.File(), help='JSON list of the contracts with name, kind (kernel or sequencer), address and rpc_url')
+@click.option('--interval', default=10.0, help='The refresh interval in seconds')
+@click.option('--workers', default=16, help='The number of concurrent requests')
+@click.option('--once', is_flag=True, default=False, help='Print the table once and exit')
+def monitor_governance(contracts_file, interval: float, workers: int, once: bool):
+    """Prints the voting state, the leader and the quorum progress of many governance contracts
+    in one table refreshed periodically"""
+
+    contracts = [MonitoredContract(**contract) for contract in json.load(contracts_file)]
+    monitor = GovernanceMonitor(contracts, workers)
+    try:
+        asyncio.run(run_monitor(monitor, interval, once))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        monitor.close()
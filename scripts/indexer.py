@@ -0,0 +1,36 @@
+import click
+import sqlite3
+import time
+from pytezos import pytezos
+from scripts.environment import load_or_ask
+from tests.helpers.indexer import GovernanceIndexer
+from typing import Optional
+
+
+@click.command()
+@click.option('--contract-address', required=True, help='The governance contract address')
+@click.option('--kind', type=click.Choice(['kernel', 'sequencer']), default='kernel', help='The kind of the governance contract')
+@click.option('--database', default='governance.sqlite', help='The SQLite database file')
+@click.option('--start-level', default=0, help='The level to start from if the database has no blocks of the contract')
+@click.option('--confirmations', default=2, help='The number of blocks after the head which are not indexed yet')
+@click.option('--poll-interval', default=5.0, help='The interval of the head polling counted in seconds')
+@click.option('--rpc-url', default=None, help='Tezos RPC URL.')
+def index_governance(
+    contract_address: str,
+    kind: str,
+    database: str,
+    start_level: int,
+    confirmations: int,
+    poll_interval: float,
+    rpc_url: Optional[str],
+):
+    """Follows the new blocks and indexes the governance contract history into SQLite"""
+
+    rpc_url = rpc_url or load_or_ask('RPC_URL')
+    client = pytezos.using(shell=rpc_url)
+    indexer = GovernanceIndexer(sqlite3.connect(database), contract_address, kind)
+
+    while True:
+        indexer.follow(client, start_level, confirmations)
+        print(f'indexed up to level {indexer.get_last_indexed_level()}')
+        time.sleep(poll_interval)
@@ -1,4 +1,7 @@
+from os.path import join
 from scripts.contract_type import ContractType
+from tests.helpers.metadata import Metadata
+from tests.helpers.utility import assert_build_is_fresh, get_build_dir
 
 base_template = {
     'version': '0.1.0',
@@ -22,8 +25,43 @@ sequencer_governance_metadata = base_template | {
     'description': 'The contract allows bakers to make proposals and vote on the sequencer operator',
 }
 
+kernel_multi_track_governance_metadata = base_template | {
+    'name': 'Etherlink Kernel Multi-Track Governance',
+    'description': 'The contract allows bakers to make proposals and vote on the regular and security kernel upgrades (kernel hash) in independent tracks',
+}
+
 metadata_by_contract_type = {
     ContractType.kernel_regular_governance: kernel_regular_governance_metadata,
     ContractType.kernel_security_governance: kernel_security_governance_metadata,
     ContractType.sequencer_governance: sequencer_governance_metadata,
-}
\ No newline at end of file
+    ContractType.kernel_multi_track_governance: kernel_multi_track_governance_metadata,
+}
+
+contract_filename_by_contract_type = {
+    ContractType.kernel_regular_governance: 'kernel_governance.tz',
+    ContractType.kernel_security_governance: 'kernel_governance.tz',
+    ContractType.sequencer_governance: 'sequencer_governance.tz',
+    ContractType.kernel_multi_track_governance: 'multi_track_kernel_governance.tz',
+}
+
+# The views are stored on-chain with the metadata, `--no_offchain_views` skips them to make the origination cheaper
+offchain_view_names = [
+    'get_voting_state',
+    'get_proposal',
+    'get_upvoter_info',
+    'get_ballot',
+    'get_last_winner',
+    'is_triggered',
+    'get_upgrade_payload',
+]
+
+def make_metadata(contract_type: ContractType, with_offchain_views: bool = True) -> dict:
+    metadata = metadata_by_contract_type[contract_type]
+    if not with_offchain_views:
+        return metadata
+
+    # NOTE: the views must be taken from the contract compiled from the current sources
+    assert_build_is_fresh()
+    filename = join(get_build_dir(), contract_filename_by_contract_type[contract_type])
+    views = Metadata.make_offchain_views(filename, offchain_view_names)
+    return metadata | {'views': views}
@@ -9,6 +9,7 @@ from contextlib import contextmanager
 from tests.helpers.contracts.internal_test_proxy import InternalTestProxy
 from tests.helpers.contracts.rollup_mock import RollupMock
 from tests.helpers.contracts.sequencer_governance import SequencerGovernance
+from tests.helpers.contracts.multi_track_kernel_governance import MultiTrackKernelGovernance
 from tests.helpers.utility import pkh
 from pytezos.contract.result import ContractCallResult
 from pytezos.operation.group import OperationGroup
@@ -71,6 +72,13 @@ class BaseTestCase(SandboxedNodeTestCase):
         self.bake_block()
         return SequencerGovernance.from_opg(self.manager, opg)
 
+    def deploy_multi_track_kernel_governance(self, custom_configs=None) -> MultiTrackKernelGovernance:
+        """Deploys Multi-Track Kernel Governance contract"""
+
+        opg = MultiTrackKernelGovernance.originate(self.manager, custom_configs).send()
+        self.bake_block()
+        return MultiTrackKernelGovernance.from_opg(self.manager, opg)
+
     @contextmanager
     def raisesMichelsonError(self, error_message):
         """Asserts that instruction fails in smart contract with the specified error"""
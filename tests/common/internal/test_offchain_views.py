@@ -0,0 +1,41 @@
+from os.path import join
+from scripts.contract_type import ContractType
+from scripts.metadata import make_metadata
+from tests.base import BaseTestCase
+from tests.helpers.metadata import Metadata
+from tests.helpers.utility import assert_build_is_fresh, get_build_dir
+
+class OffchainViewsTestCase(BaseTestCase):
+    def test_should_make_offchain_views_from_onchain_views(self) -> None:
+        assert_build_is_fresh()
+        filename = join(get_build_dir(), 'kernel_governance.tz')
+        views = Metadata.make_offchain_views(filename)
+
+        get_voting_state = next(view for view in views if view['name'] == 'get_voting_state')
+        implementation = get_voting_state['implementations'][0]['michelsonStorageView']
+        assert implementation['parameter'] == {'prim': 'unit'}
+        assert implementation['returnType']['prim'] == 'pair'
+        assert isinstance(implementation['code'], list)
+
+    def test_should_filter_offchain_views_by_name(self) -> None:
+        assert_build_is_fresh()
+        filename = join(get_build_dir(), 'kernel_governance.tz')
+
+        assert Metadata.make_offchain_views(filename, ['unknown_view']) == []
+        assert [view['name'] for view in Metadata.make_offchain_views(filename, ['get_voting_state'])] == ['get_voting_state']
+
+    def test_should_publish_all_views_in_metadata(self) -> None:
+        view_names = [
+            'get_voting_state',
+            'get_proposal',
+            'get_upvoter_info',
+            'get_ballot',
+            'get_last_winner',
+            'is_triggered',
+            'get_upgrade_payload',
+        ]
+        for contract_type in ContractType:
+            metadata = make_metadata(contract_type)
+            views = {view['name']: view['implementations'][0] for view in metadata['views']}
+            assert sorted(views) == sorted(view_names), contract_type
+            assert all('michelsonStorageView' in implementation for implementation in views.values())
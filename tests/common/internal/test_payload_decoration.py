@@ -1,4 +1,5 @@
 from tests.base import BaseTestCase
+from tests.helpers.errors import VALUE_EXCEEDS_UINT64
 
 class PayloadDecorationTestCase(BaseTestCase):
     def test_kernel_upgrade_payload_decoration(self) -> None:
@@ -10,6 +11,26 @@ class PayloadDecorationTestCase(BaseTestCase):
         expected_upgrade_payload = 'eba1009279df4982e47cf101e2525b605fa06cd3ccc0f67d1c792a6a3ea56af9606abc8880ccd46500000000'
         assert proxy.get_kernel_upgrade_payload(kernel_root_hash, activation_timestamp).hex() == expected_upgrade_payload
 
+    def test_activation_timestamp_is_padded_to_8_bytes(self) -> None:
+        proxy = self.deploy_internal_test_proxy()
+
+        kernel_root_hash = bytes.fromhex('009279df4982e47cf101e2525b605fa06cd3ccc0f67d1c792a6a3ea56af9606abc')
+
+        expected_upgrade_payload = 'eba1009279df4982e47cf101e2525b605fa06cd3ccc0f67d1c792a6a3ea56af9606abc880000000000000000'
+        assert proxy.get_kernel_upgrade_payload(kernel_root_hash, 0).hex() == expected_upgrade_payload
+
+        expected_upgrade_payload = 'eba1009279df4982e47cf101e2525b605fa06cd3ccc0f67d1c792a6a3ea56af9606abc880100000000000000'
+        assert proxy.get_kernel_upgrade_payload(kernel_root_hash, 1).hex() == expected_upgrade_payload
+
+        expected_upgrade_payload = 'eba1009279df4982e47cf101e2525b605fa06cd3ccc0f67d1c792a6a3ea56af9606abc880000000001000000'
+        assert proxy.get_kernel_upgrade_payload(kernel_root_hash, 2**32).hex() == expected_upgrade_payload
+
+        expected_upgrade_payload = 'eba1009279df4982e47cf101e2525b605fa06cd3ccc0f67d1c792a6a3ea56af9606abc88ffffffffffffffff'
+        assert proxy.get_kernel_upgrade_payload(kernel_root_hash, 2**64 - 1).hex() == expected_upgrade_payload
+
+        with self.raisesMichelsonError(VALUE_EXCEEDS_UINT64):
+            proxy.get_kernel_upgrade_payload(kernel_root_hash, 2**64)
+
     def test_sequencer_upgrade_payload_decoration(self) -> None:
         proxy = self.deploy_internal_test_proxy()
 
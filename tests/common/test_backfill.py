@@ -0,0 +1,94 @@
+import sqlite3
+from tests.base import BaseTestCase
+from tests.helpers.backfill import VotingReplay, backfill
+from tests.helpers.contracts.governance_base import PROMOTION_PERIOD, PROPOSAL_PERIOD, YEA_VOTE
+from tests.helpers.indexer import GovernanceIndexer, PeriodState
+from tests.helpers.storage import Config, GovernanceStorage, PromotionPeriod
+from tests.helpers.utility import DEFAULT_TOTAL_VOTING_POWER, DEFAULT_VOTING_POWER
+from tests.helpers.voting_state import VotingFinished, compute_voting_state
+
+class VotingReplayTestCase(BaseTestCase):
+    def make_block(self, level: int, sender: str, entrypoint: str, value: dict, voting_power: int) -> dict:
+        transaction = {
+            'kind': 'transaction',
+            'source': sender,
+            'destination': 'KT1governance',
+            'parameters': {'entrypoint': entrypoint, 'value': value},
+        }
+        return {
+            'header': {'level': str(level)},
+            'operations': [[], [], [], [
+                {'hash': f'op{level}', 'contents': [dict(transaction, metadata={'operation_result': {'status': 'applied'}})]},
+            ]],
+            'governance_context': {'total_voting_power': 100, 'voting_powers': {sender: voting_power}},
+        }
+
+    def test_should_fold_calls_without_events_into_voting_context(self) -> None:
+        baker = 'tz1KqTpEZ7Yob7QbPE4Hy4Wo8fHG8LhKxZSx'
+        kernel_root_hash = bytes.fromhex('01' * 33)
+        indexer = GovernanceIndexer(sqlite3.connect(':memory:'), 'KT1governance')
+        config = Config(0, 2, 60, 20, 100, 20, 20, 20)
+        replay = VotingReplay(GovernanceStorage(config, None, None, 1, 2, 3, 4, 5), {})
+
+        # Period index: 0
+        replay.apply_block(self.make_block(1, baker, 'new_proposal', {'bytes': kernel_root_hash.hex()}, 50), indexer)
+        assert compute_voting_state(replay.storage, 2).period_type == PROMOTION_PERIOD
+
+        # Period index: 1
+        replay.apply_block(self.make_block(2, baker, 'vote', {'string': YEA_VOTE}, 50), indexer)
+        assert replay.storage.voting_context.period == PromotionPeriod(50, 0, 0, 100, kernel_root_hash)
+
+        # Period index: 2
+        assert compute_voting_state(replay.storage, 4).finished_voting == VotingFinished(2, PROMOTION_PERIOD, kernel_root_hash)
+
+
+class BackfillTestCase(BaseTestCase):
+    def test_should_backfill_history_and_resume_from_checkpoint(self) -> None:
+        baker = self.bootstrap_baker()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 2
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        # Period index: 0. Block: 2 of 2
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_block()
+        # Period index: 1. Block: 1 of 2
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_block()
+        checkpoint_level = self.get_current_level()
+        # Period index: 3. Block: 1 of 2
+        self.bake_blocks(3)
+        governance.using(baker).advance_period().send()
+        self.bake_block()
+
+        indexer = GovernanceIndexer(sqlite3.connect(':memory:'), governance.address)
+        assert backfill(indexer, self.manager, governance_started_at_level, checkpoint_level, workers=4, chunk_size=1) == 2
+        assert indexer.get_last_indexed_level() == checkpoint_level
+
+        progress = []
+        operations_count = backfill(
+            indexer,
+            self.manager,
+            governance_started_at_level,
+            self.get_current_level(),
+            workers=4,
+            chunk_size=2,
+            on_progress=lambda level, _: progress.append(level),
+        )
+        assert operations_count == 1
+        assert progress[-1] == self.get_current_level()
+        assert indexer.get_last_indexed_level() == self.get_current_level()
+
+        assert indexer.get_period_states() == [
+            PeriodState(0, PROPOSAL_PERIOD, DEFAULT_TOTAL_VOTING_POWER, {kernel_root_hash.hex(): DEFAULT_VOTING_POWER}, {}, None),
+            PeriodState(1, PROMOTION_PERIOD, DEFAULT_TOTAL_VOTING_POWER, {}, {YEA_VOTE: DEFAULT_VOTING_POWER}, (PROMOTION_PERIOD, kernel_root_hash.hex())),
+            PeriodState(3, PROPOSAL_PERIOD, DEFAULT_TOTAL_VOTING_POWER, {}, {}, None),
+        ]
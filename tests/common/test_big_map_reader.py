@@ -0,0 +1,78 @@
+from tests.base import BaseTestCase
+from tests.helpers.big_map_reader import VOTERS_KEY_TYPE, BigMapReader, ProposalRecord, decode_ballot_value
+from tests.helpers.contracts.governance_base import YEA_VOTE
+from tests.helpers.contracts.sequencer_governance import SequencerGovernance
+from tests.helpers.storage import SequencerPayload, decode_sequencer_payload
+from tests.helpers.utility import DEFAULT_VOTING_POWER
+
+class BigMapReaderTestCase(BaseTestCase):
+    def test_should_read_period_big_maps_and_cache_finished_periods(self) -> None:
+        baker = self.bootstrap_baker()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 2
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        # Period index: 0. Block: 2 of 2
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_block()
+        # Period index: 1. Block: 1 of 2
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_block()
+
+        # the page size is smaller than the listings, so the key hashes are listed in several pages
+        reader = BigMapReader(self.manager, governance.get_storage(), workers=4, page_size=1)
+        baker_key_hash = baker.key.public_key_hash()
+
+        period = reader.read_period(0)
+        assert period.proposals == {kernel_root_hash: ProposalRecord(baker_key_hash, DEFAULT_VOTING_POWER)}
+        assert period.upvoters_proposals == {baker_key_hash: {kernel_root_hash}}
+        assert period.ballots == {}
+        assert period.payloads == {}
+
+        period = reader.read_period(1)
+        assert period.proposals == {}
+        assert period.ballots == {baker_key_hash: YEA_VOTE}
+
+        # only the period finished at the head block is cached
+        storage = governance.get_storage()
+        assert set(reader.cache) == {(storage.proposals, 0), (storage.upvoters_proposals, 0), (storage.voters, 0), (storage.payloads, 0)}
+
+        # Period index: 1. Block: 2 of 2
+        self.bake_block()
+        reader.read_period(1)
+        assert (storage.voters, 1) in reader.cache
+
+        # the missing keys are skipped
+        block_hash = self.manager.shell.head.hash()
+        keys = [(1, baker_key_hash), (2, baker_key_hash)]
+        assert reader.fetch_values(block_hash, storage.voters, keys, VOTERS_KEY_TYPE, decode_ballot_value) == {(1, baker_key_hash): YEA_VOTE}
+
+    def test_should_read_sequencer_payloads(self) -> None:
+        baker = self.bootstrap_baker()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 2
+        governance = self.deploy_sequencer_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+        })
+
+        sequencer_pk = 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X'
+        pool_address = 'B7A97043983f24991398E5a82f63F4C58a417185'
+        # Period index: 0. Block: 2 of 2
+        governance.using(baker).new_proposal(sequencer_pk, pool_address).send()
+        self.bake_block()
+
+        reader = BigMapReader(self.manager, governance.get_storage())
+        period = reader.read_period(0, decode_sequencer_payload)
+        proposal_key = SequencerGovernance.get_proposal_key(sequencer_pk, pool_address)
+        assert set(period.proposals) == {proposal_key}
+        assert period.payloads == {proposal_key: SequencerPayload(sequencer_pk, bytes.fromhex(pool_address))}
@@ -0,0 +1,90 @@
+import asyncio
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import PROMOTION_PERIOD, YEA_VOTE
+from tests.helpers.event_stream import ChainFollower, GovernanceEvent, stream_governance_events
+
+class ChainFollowerTestCase(BaseTestCase):
+    def make_blocks(self, *blocks: tuple[str, int, str]) -> dict[str, dict]:
+        return {
+            block_hash: {'hash': block_hash, 'header': {'level': level, 'predecessor': predecessor}}
+            for block_hash, level, predecessor in blocks
+        }
+
+    def test_should_fill_level_gaps_and_detect_reorganizations(self) -> None:
+        blocks = self.make_blocks(
+            ('a1', 1, 'a0'), ('a2', 2, 'a1'), ('a3', 3, 'a2'), ('a4', 4, 'a3'), ('a5', 5, 'a4'),
+            ('b3', 3, 'a2'), ('b4', 4, 'b3'),
+        )
+        follower = ChainFollower(lambda block_hash: blocks[block_hash], max_reorg_depth=3)
+
+        def apply_head(block_hash: str):
+            reorganized_level, new_blocks = follower.apply_head(block_hash)
+            return reorganized_level, [block['hash'] for block in new_blocks]
+
+        assert apply_head('a1') == (None, ['a1'])
+        assert apply_head('a1') == (None, [])
+        assert apply_head('a3') == (None, ['a2', 'a3'])
+        assert apply_head('b4') == (3, ['b3', 'b4'])
+        assert apply_head('a5') == (3, ['a3', 'a4', 'a5'])
+        assert follower.recent_hashes == {3: 'a3', 4: 'a4', 5: 'a5'}
+
+
+class GovernanceEventStreamTestCase(BaseTestCase):
+    def test_should_stream_governance_events_of_new_blocks(self) -> None:
+        baker = self.bootstrap_baker()
+        rollup_mock = self.deploy_rollup_mock()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 2
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+
+        def run_voting() -> None:
+            # Period index: 0. Block: 2 of 2
+            governance.using(baker).new_proposal(kernel_root_hash).send()
+            self.bake_block()
+            # Period index: 1. Block: 1 of 2
+            governance.using(baker).vote(YEA_VOTE).send()
+            self.bake_block()
+            # Period index: 2. Block: 1 of 2
+            self.bake_block()
+            governance.using(baker).trigger_kernel_upgrade(rollup_mock.contract.address).send()
+            self.bake_block()
+
+        async def collect_events() -> list[GovernanceEvent]:
+            events = []
+            connected = asyncio.Event()
+            stream = stream_governance_events(self.manager, governance.address, stop_check_interval=1, connected=connected)
+
+            async def consume():
+                async for event in stream:
+                    events.append(event)
+                    if len(events) == 7:
+                        return
+
+            consumer = asyncio.create_task(consume())
+            # NOTE: the head monitor only reports the blocks baked after the stream is opened
+            await asyncio.wait_for(connected.wait(), timeout=10)
+            await asyncio.to_thread(run_voting)
+            await asyncio.wait_for(consumer, timeout=60)
+            await stream.aclose()
+            return events
+
+        events = asyncio.run(collect_events())
+        assert [event.kind for event in events] == [
+            'period_started', 'new_proposal',
+            'period_started', 'vote',
+            'trigger', 'voting_finished', 'period_started',
+        ]
+        voting_finished = events[5].data
+        assert voting_finished['finished_at_period_index'] == 2
+        assert voting_finished['finished_at_period_type'] == PROMOTION_PERIOD
+        assert voting_finished['winner_proposal_payload'] == kernel_root_hash
+        assert events[4].data['rollup_address'] == rollup_mock.contract.address
+        assert all(event.block_timestamp is not None for event in events)
@@ -0,0 +1,44 @@
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import YEA_VOTE
+from tests.helpers.utility import find_op_by_hash, get_events_from_op
+
+class KernelGovernanceEventsTestCase(BaseTestCase):
+    def get_event_tags(self, opg) -> list[str]:
+        op = find_op_by_hash(self.manager, opg)
+        return [event['tag'] for event in get_events_from_op(op)]
+
+    def test_should_emit_events_for_voting_operations_and_period_starts(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 3
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 3,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        # Period index: 0. Block: 2 of 3
+        opg = governance.using(baker1).new_proposal(kernel_root_hash).send()
+        self.bake_block()
+        assert self.get_event_tags(opg) == ['period_started', 'new_proposal']
+
+        # Period index: 0. Block: 3 of 3
+        opg = governance.using(baker2).upvote_proposal(kernel_root_hash).send()
+        self.bake_block()
+        assert self.get_event_tags(opg) == ['upvote_proposal']
+
+        # Period index: 1. Block: 1 of 3
+        opg = governance.using(baker1).vote(YEA_VOTE).send()
+        self.bake_block()
+        assert self.get_event_tags(opg) == ['period_started', 'vote']
+
+        # Period index: 2. Block: 1 of 3
+        self.bake_blocks(2)
+        opg = governance.using(baker1).advance_period().send()
+        self.bake_block()
+        assert self.get_event_tags(opg) == ['voting_finished', 'period_started']
@@ -1,6 +1,8 @@
 import secrets
 from tests.base import BaseTestCase
 from tests.helpers.contracts.governance_base import YEA_VOTE
+from tests.helpers.contracts.kernel_governance import KernelGovernance
+from tests.helpers.contracts.multi_track_kernel_governance import MultiTrackKernelGovernance, REGULAR_TRACK
 from tests.helpers.operation_result_recorder import OperationResultRecorder
 from tests.helpers.utility import find_op_by_hash, get_tests_dir, pkh
 from pytezos.operation.result import OperationResult
@@ -14,6 +16,30 @@ class KernelGovernanceGasConsumptionTestCase(BaseTestCase):
         self.recorder.write_to_file(join(get_tests_dir(), 'gas_consumption.json'))
         super().tearDownClass()
 
+    def test_origination(self) -> None:
+        # the regular and security kernel tracks as two standalone contracts vs one multi-track contract
+        for i in range(2):
+            opg = KernelGovernance.originate(self.manager).send()
+            self.bake_block()
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'kernel_governance_origination_nth_{i + 1}', op)
+
+        opg = MultiTrackKernelGovernance.originate(self.manager).send()
+        self.bake_block()
+        op = find_op_by_hash(self.manager, opg)
+        self.recorder.add_element(f'multi_track_kernel_governance_origination', op)
+
+    def test_multi_track_new_proposal(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_multi_track_kernel_governance()
+
+        # compare with new_proposal_same_baker_nth_*
+        for i in range(4):
+            opg = governance.using(baker).new_proposal(REGULAR_TRACK, secrets.token_bytes(33)).send()
+            self.bake_block()
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'multi_track_new_proposal_same_baker_nth_{i + 1}', op)
+
     def test_new_proposal_same_baker(self) -> None:
         baker = self.bootstrap_baker()
         governance_started_at_level = self.get_current_level() + 1
@@ -49,6 +75,44 @@ class KernelGovernanceGasConsumptionTestCase(BaseTestCase):
             op = find_op_by_hash(self.manager, opg)
             self.recorder.add_element(f'new_proposal_different_baker_nth_{i + 1}', op)
 
+    def test_new_proposal_first_in_period(self) -> None:
+        baker = self.bootstrap_baker()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 3,
+            'proposal_quorum': 80, # proposals never reach quorum, so every period is a proposal one
+        })
+
+        for i in range(3):
+            opg = governance.using(baker).new_proposal(secrets.token_bytes(33)).send()
+            self.bake_block()
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'new_proposal_first_in_period_nth_{i + 1}', op)
+            self.bake_blocks(2)
+
+    def test_new_proposal_after_advance_period(self) -> None:
+        baker = self.bootstrap_baker()
+        no_baker = self.bootstrap_no_baker()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 4,
+            'proposal_quorum': 80, # proposals never reach quorum, so every period is a proposal one
+        })
+
+        # compare with new_proposal_first_in_period_nth_*: the transition is paid by advance_period
+        for i in range(3):
+            opg = governance.using(no_baker).advance_period().send()
+            self.bake_block()
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'advance_period_nth_{i + 1}', op)
+            opg = governance.using(baker).new_proposal(secrets.token_bytes(33)).send()
+            self.bake_block()
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'new_proposal_after_advance_period_nth_{i + 1}', op)
+            self.bake_blocks(2)
+
     def test_new_proposal_with_event(self) -> None:
         baker1 = self.bootstrap_baker()
         governance_started_at_level = self.get_current_level() + 1
@@ -93,6 +157,93 @@ class KernelGovernanceGasConsumptionTestCase(BaseTestCase):
             op = find_op_by_hash(self.manager, opg)
             self.recorder.add_element(f'upvote_nth_{i + 1}', op)
 
+    def test_upvote_with_upvoted_proposals(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        upvoting_limit = 20
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 500,
+            'upvoting_limit': upvoting_limit,
+        })
+
+        kernel_root_hashes = [secrets.token_bytes(33) for _ in range(upvoting_limit)]
+        for kernel_root_hash in kernel_root_hashes:
+            governance.using(baker1).new_proposal(kernel_root_hash).send()
+            self.bake_block()
+
+        # the upvoter set is read and written by every upvote, compare its smallest and its largest size
+        opg = governance.using(baker2).upvote_proposal(kernel_root_hashes[0]).send()
+        self.bake_block()
+        op = find_op_by_hash(self.manager, opg)
+        self.recorder.add_element(f'upvote_with_1_upvoted_proposal', op)
+
+        governance.using(baker2).upvote_proposals(kernel_root_hashes[1:-1]).send()
+        self.bake_block()
+        opg = governance.using(baker2).upvote_proposal(kernel_root_hashes[-1]).send()
+        self.bake_block()
+        op = find_op_by_hash(self.manager, opg)
+        self.recorder.add_element(f'upvote_with_{upvoting_limit}_upvoted_proposals', op)
+
+    def test_upvote_proposals(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        baker3 = self.bootstrap_baker()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 500,
+            'upvoting_limit': 500,
+        })
+
+        kernel_root_hashes = [secrets.token_bytes(33) for _ in range(10)]
+        for kernel_root_hash in kernel_root_hashes:
+            governance.using(baker1).new_proposal(kernel_root_hash).send()
+            self.bake_block()
+
+        offset = 0
+        for batch_size in [1, 3, 6]:
+            batch = kernel_root_hashes[offset:offset + batch_size]
+            offset += batch_size
+            opg = governance.using(baker2).upvote_proposals(batch).send()
+            self.bake_block()
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'upvote_proposals_batch_of_{batch_size}', op)
+
+        # the same upvotes one by one, the amortized gas of a batch is compared with the sum of its single upvotes
+        for i, kernel_root_hash in enumerate(kernel_root_hashes):
+            opg = governance.using(baker3).upvote_proposal(kernel_root_hash).send()
+            self.bake_block()
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'upvote_proposal_same_upvoter_nth_{i + 1}', op)
+
+    def test_get_voting_state_view(self) -> None:
+        baker = self.bootstrap_baker()
+        proxy = self.deploy_internal_test_proxy()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 4,
+            'proposal_quorum': 20, # 1 baker out of 5 will vote
+        })
+
+        governance.using(baker).new_proposal(secrets.token_bytes(33)).send()
+        self.bake_block()
+
+        # the voting context in storage is the current one
+        opg = proxy.using(baker).call_get_voting_state(governance.address).send()
+        self.bake_block()
+        op = find_op_by_hash(self.manager, opg)
+        self.recorder.add_element(f'get_voting_state_view_same_period', op)
+
+        # the voting context in storage is outdated and the transition is computed by the view
+        self.bake_blocks(2)
+        opg = proxy.using(baker).call_get_voting_state(governance.address).send()
+        self.bake_block()
+        op = find_op_by_hash(self.manager, opg)
+        self.recorder.add_element(f'get_voting_state_view_pending_transition', op)
+
     def test_vote_proposal(self) -> None:
         baker1 = self.bootstrap_baker()
         baker2 = self.bootstrap_baker()
@@ -176,6 +327,61 @@ class KernelGovernanceGasConsumptionTestCase(BaseTestCase):
             self.bake_blocks(10)
             op = find_op_by_hash(self.manager, opg)
             self.recorder.add_element(f'trigger_upgrade_nth_{i + 1}', op)
+
+    def test_trigger_upgrades(self) -> None:
+        baker = self.bootstrap_baker()
+        rollup_mocks = [self.deploy_rollup_mock() for _ in range(6)]
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 6,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_blocks(7)
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_blocks(7)
+
+        # compare consumed gas divided by the batch size with trigger_upgrade_nth_*
+        offset = 0
+        for batch_size in [1, 5]:
+            batch = rollup_mocks[offset:offset + batch_size]
+            offset += batch_size
+            opg = governance.using(baker).trigger_kernel_upgrades([mock.contract.address for mock in batch]).send()
+            self.bake_blocks(10)
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'trigger_upgrades_batch_of_{batch_size}', op)
+
+    def test_trigger_committee_upgrade(self) -> None:
+        baker = self.bootstrap_baker()
+        rollup_mock1 = self.deploy_rollup_mock()
+        rollup_mock2 = self.deploy_rollup_mock()
+        rollup_mock3 = self.deploy_rollup_mock()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_sequencer_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 6,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        sequencer_pk = 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X'
+        pool_address = 'B7A97043983f24991398E5a82f63F4C58a417185'
+        governance.using(baker).new_proposal(sequencer_pk, pool_address).send()
+        self.bake_blocks(7)
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_blocks(7)
+        
+        for i, mock in enumerate([rollup_mock1, rollup_mock2, rollup_mock3]):
+            opg = governance.using(baker).trigger_committee_upgrade(mock.contract.address).send()
+            self.bake_blocks(10)
+            op = find_op_by_hash(self.manager, opg)
+            self.recorder.add_element(f'trigger_committee_upgrade_nth_{i + 1}', op)
         
     # def test_new_proposal_stress(self) -> None:
     #     baker = self.bootstrap_baker()
@@ -0,0 +1,68 @@
+import asyncio
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import PROMOTION_PERIOD, YEA_VOTE
+from tests.helpers.governance_monitor import GovernanceMonitor, MonitoredContract, render_table
+from tests.helpers.storage import SequencerPayload
+from tests.helpers.utility import DEFAULT_VOTING_POWER
+
+class GovernanceMonitorTestCase(BaseTestCase):
+    def test_should_refresh_many_contracts_concurrently(self) -> None:
+        baker = self.bootstrap_baker()
+        # deploying each contract will take 1 block, the period starts with the first one
+        governance_started_at_level = self.get_current_level() + 1
+        config = {
+            'started_at_level': governance_started_at_level,
+            'period_length': 4,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        }
+        # Period index: 0. Block: 1 of 4
+        kernel_governance = self.deploy_kernel_governance(custom_config=config)
+        # Period index: 0. Block: 2 of 4
+        sequencer_governance = self.deploy_sequencer_governance(custom_config=config)
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        sequencer_pk = 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X'
+        pool_address = 'B7A97043983f24991398E5a82f63F4C58a417185'
+        # Period index: 0. Block: 3 of 4
+        kernel_governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_block()
+        # Period index: 0. Block: 4 of 4
+        sequencer_governance.using(baker).new_proposal(sequencer_pk, pool_address).send()
+        self.bake_block()
+        # Period index: 1. Block: 1 of 4
+        kernel_governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_block()
+
+        rpc_url = self.manager.shell.node.uri[0]
+        contracts = [
+            MonitoredContract('kernel', 'kernel', kernel_governance.address, rpc_url),
+            MonitoredContract('sequencer', 'sequencer', sequencer_governance.address, rpc_url),
+            MonitoredContract('unknown', 'kernel', 'KT1RJ6PbjHpwc3M5rw5s2Nbmefwbuwbdxton', rpc_url),
+        ]
+        monitor = GovernanceMonitor(contracts, workers=4)
+        try:
+            kernel, sequencer, unknown = asyncio.run(monitor.refresh())
+        finally:
+            monitor.close()
+
+        assert kernel.level == self.get_current_level()
+        assert kernel.voting_state.period_index == 1
+        assert kernel.voting_state.period_type == PROMOTION_PERIOD
+        assert kernel.voting_state.remaining_blocks == 4
+        assert kernel.leader == kernel_root_hash
+        assert kernel.leader_voting_power == DEFAULT_VOTING_POWER
+        assert kernel.quorum_progress >= 1
+
+        # the promotion period of the sequencer governance has no ballots yet
+        assert sequencer.voting_state.period_type == PROMOTION_PERIOD
+        assert sequencer.leader == SequencerPayload(sequencer_pk, bytes.fromhex(pool_address))
+        assert sequencer.leader_voting_power is None
+        assert sequencer.quorum_progress == 0
+        assert isinstance(unknown, Exception)
+
+        table = render_table([kernel, sequencer, unknown], contracts).splitlines()
+        assert len(table) == 4
+        assert kernel_root_hash.hex() in table[1]
+        assert 'error' in table[3]
@@ -0,0 +1,60 @@
+from dataclasses import asdict
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import PROPOSAL_PERIOD
+from tests.helpers.head_cache import HeadCache
+
+class HeadCacheTestCase(BaseTestCase):
+    def test_should_evict_least_recently_used_entries(self) -> None:
+        cache = HeadCache(max_size=2)
+        cache.set_head('block1', 1)
+
+        assert cache.get('KT1', 'block1', 'a', lambda: 1) == 1
+        assert cache.get('KT1', 'block1', 'b', lambda: 2) == 2
+        assert cache.get('KT1', 'block1', 'a', lambda: None) == 1
+        assert cache.get('KT1', 'block1', 'c', lambda: 3) == 3
+        # 'b' was evicted as the least recently used one
+        assert cache.get('KT1', 'block1', 'b', lambda: 4) == 4
+        assert cache.hits == 1
+        assert cache.misses == 4
+
+    def test_should_drop_entries_of_previous_heads(self) -> None:
+        cache = HeadCache()
+        cache.set_head('block1', 1)
+        cache.get('KT1', 'block1', 'a', lambda: 1)
+
+        cache.set_head('block1', 1)
+        assert cache.get('KT1', 'block1', 'a', lambda: None) == 1
+
+        cache.set_head('block2', 2)
+        assert len(cache.entries) == 0
+        assert cache.get('KT1', 'block2', 'a', lambda: 2) == 2
+
+    def test_should_read_governance_state_once_per_head(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_kernel_governance()
+        cache = HeadCache()
+        cached_governance = governance.using(baker)
+        cached_governance.cache = cache
+
+        state = cached_governance.get_voting_state()
+        assert state['period_type'] == PROPOSAL_PERIOD
+        for _ in range(5):
+            assert cached_governance.get_voting_state() == state
+            assert cached_governance.get_upvoter_info(baker.key.public_key_hash()) == governance.get_upvoter_info(baker.key.public_key_hash())
+        # each view is run once
+        assert cache.misses == 2
+        assert cache.hits == 9
+
+        # the local voting state is computed from the storage fetched once
+        assert asdict(cached_governance.compute_voting_state()) == state
+        assert asdict(cached_governance.compute_voting_state()) == state
+        assert cache.misses == 4
+        assert cache.hits == 10
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_block()
+        # the reads are refreshed on the new head
+        assert cached_governance.get_storage().voting_context.period.winner_candidate == kernel_root_hash
+        assert cached_governance.get_voting_state() == governance.get_voting_state()
+        assert cache.head_hash == baker.shell.head.hash()
@@ -0,0 +1,146 @@
+import sqlite3
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import PROMOTION_PERIOD, PROPOSAL_PERIOD, YEA_VOTE
+from tests.helpers.indexer import GovernanceIndexer, get_governance_operations
+from tests.helpers.utility import DEFAULT_TOTAL_VOTING_POWER, DEFAULT_VOTING_POWER, to_micheline
+
+class GovernanceOperationsTestCase(BaseTestCase):
+    def make_transaction(self, source: str, destination: str, entrypoint: str, status: str = 'applied') -> dict:
+        return {
+            'kind': 'transaction',
+            'source': source,
+            'destination': destination,
+            'parameters': {'entrypoint': entrypoint, 'value': {'prim': 'Unit'}},
+            'result': {'status': status},
+        }
+
+    def test_should_find_top_level_and_internal_calls(self) -> None:
+        governance, proxy, rollup, baker = 'KT1governance', 'KT1proxy', 'sr1rollup', 'tz1baker'
+        event = {'kind': 'event', 'source': governance, 'tag': 'period_started', 'result': {'status': 'applied'}}
+        vote = self.make_transaction(baker, governance, 'vote')
+        proxy_call = self.make_transaction(baker, proxy, 'default')
+        failed_vote = self.make_transaction(baker, governance, 'vote')
+        block = {'operations': [[], [], [], [
+            {'hash': 'op1', 'contents': [dict(vote, metadata={
+                'operation_result': {'status': 'applied'},
+                'internal_operation_results': [event],
+            })]},
+            {'hash': 'op2', 'contents': [dict(proxy_call, metadata={
+                'operation_result': {'status': 'applied'},
+                'internal_operation_results': [
+                    self.make_transaction(proxy, governance, 'trigger_kernel_upgrade'),
+                    self.make_transaction(governance, rollup, 'default'),
+                    event,
+                    self.make_transaction(proxy, governance, 'advance_period', status='backtracked'),
+                ],
+            })]},
+            {'hash': 'op3', 'contents': [dict(failed_vote, metadata={
+                'operation_result': {'status': 'failed'},
+            })]},
+        ]]}
+
+        calls = get_governance_operations(block, governance)
+        assert [(call.op_hash, call.sender, call.entrypoint) for call in calls] == [
+            ('op1', baker, 'vote'),
+            ('op2', proxy, 'trigger_kernel_upgrade'),
+        ]
+        assert [result['kind'] for result in calls[0].emitted] == ['event']
+        assert [(result['kind'], result['destination'] if result['kind'] == 'transaction' else None) for result in calls[1].emitted] == [
+            ('transaction', rollup),
+            ('event', None),
+        ]
+
+    def test_should_index_calls_from_events_without_block_context(self) -> None:
+        governance, baker = 'KT1governance', 'tz1KqTpEZ7Yob7QbPE4Hy4Wo8fHG8LhKxZSx'
+        kernel_root_hash = '01' * 33
+        period_started = {
+            'kind': 'event',
+            'source': governance,
+            'tag': 'period_started',
+            'type': to_micheline('pair (nat %period_index) (pair (or %period_type (unit %proposal) (unit %promotion)) (nat %total_voting_power))'),
+            'payload': {'prim': 'Pair', 'args': [{'int': '0'}, {'prim': 'Left', 'args': [{'prim': 'Unit'}]}, {'int': '100'}]},
+            'result': {'status': 'applied'},
+        }
+        new_proposal = {
+            'kind': 'event',
+            'source': governance,
+            'tag': 'new_proposal',
+            'type': to_micheline('pair (nat %period_index) (pair (key_hash %proposer) (pair (bytes %payload) (nat %voting_power)))'),
+            'payload': {'prim': 'Pair', 'args': [{'int': '0'}, {'string': baker}, {'bytes': kernel_root_hash}, {'int': '10'}]},
+            'result': {'status': 'applied'},
+        }
+        transaction = self.make_transaction(baker, governance, 'new_proposal')
+        block = {
+            'hash': 'BLhash',
+            'header': {'level': '10', 'timestamp': '2024-01-01T00:00:00Z'},
+            'operations': [[], [], [], [
+                {'hash': 'op1', 'contents': [dict(transaction, metadata={
+                    'operation_result': {'status': 'applied'},
+                    'internal_operation_results': [period_started, new_proposal],
+                })]},
+            ]],
+            # NOTE: no storage and voting powers are fetched for the calls with events
+            'governance_context': None,
+        }
+
+        indexer = GovernanceIndexer(sqlite3.connect(':memory:'), governance)
+        assert indexer.apply_block(block) == 1
+        assert indexer.get_proposals(0) == [(kernel_root_hash, baker, 10)]
+        periods = indexer.connection.execute('SELECT period_index, period_type, total_voting_power, level FROM periods').fetchall()
+        assert periods == [(0, PROPOSAL_PERIOD, 100, 10)]
+
+
+class GovernanceIndexerTestCase(BaseTestCase):
+    def test_should_index_kernel_governance_history(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        rollup_mock = self.deploy_rollup_mock()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 3
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 3,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        # Period index: 0. Block: 2 of 3
+        governance.using(baker1).new_proposal(kernel_root_hash).send()
+        self.bake_block()
+        # Period index: 0. Block: 3 of 3
+        governance.using(baker2).upvote_proposal(kernel_root_hash).send()
+        self.bake_block()
+        # Period index: 1. Block: 1 of 3
+        governance.using(baker1).vote(YEA_VOTE).send()
+        self.bake_block()
+        # Period index: 2. Block: 1 of 3
+        self.bake_blocks(2)
+        governance.using(baker1).trigger_kernel_upgrade(rollup_mock.contract.address).send()
+        self.bake_block()
+
+        indexer = GovernanceIndexer(sqlite3.connect(':memory:'), governance.address)
+        indexer.follow(self.manager, governance_started_at_level, confirmations=0)
+        assert indexer.get_last_indexed_level() == self.get_current_level()
+
+        assert indexer.get_proposals(0) == [(kernel_root_hash.hex(), baker1.key.public_key_hash(), DEFAULT_VOTING_POWER * 2)]
+        assert indexer.get_ballots_summary(1) == {YEA_VOTE: DEFAULT_VOTING_POWER}
+        assert indexer.get_winners() == [(2, kernel_root_hash.hex(), self.get_current_level())]
+
+        periods = indexer.connection.execute('SELECT period_index, period_type, total_voting_power FROM periods ORDER BY period_index').fetchall()
+        assert periods == [
+            (0, PROPOSAL_PERIOD, DEFAULT_TOTAL_VOTING_POWER),
+            (1, PROMOTION_PERIOD, DEFAULT_TOTAL_VOTING_POWER),
+            (2, PROPOSAL_PERIOD, DEFAULT_TOTAL_VOTING_POWER),
+        ]
+        triggers = indexer.connection.execute('SELECT rollup_address, upgrade_payload FROM triggers').fetchall()
+        assert triggers == [(rollup_mock.contract.address, rollup_mock.contract.storage().hex())]
+        entrypoints = indexer.connection.execute('SELECT entrypoint FROM operations ORDER BY level').fetchall()
+        assert entrypoints == [('new_proposal',), ('upvote_proposal',), ('vote',), ('trigger_kernel_upgrade',)]
+
+        # the indexer resumes from the last indexed block
+        self.bake_block()
+        indexer.follow(self.manager, governance_started_at_level, confirmations=0)
+        assert indexer.get_last_indexed_level() == self.get_current_level()
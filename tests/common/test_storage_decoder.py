@@ -0,0 +1,103 @@
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import YEA_VOTE
+from tests.helpers.storage import (
+    Config,
+    ProposalPeriod,
+    PromotionPeriod,
+    SequencerPayload,
+    decode_kernel_governance_storage,
+    unpair,
+)
+from tests.helpers.utility import DEFAULT_VOTING_POWER, DEFAULT_TOTAL_VOTING_POWER
+
+class StorageDecoderTestCase(BaseTestCase):
+    def test_should_unpair_all_comb_notations(self) -> None:
+        a, b, c = {'int': '1'}, {'int': '2'}, {'int': '3'}
+
+        assert unpair({'prim': 'Pair', 'args': [a, {'prim': 'Pair', 'args': [b, c]}]}, 3) == [a, b, c]
+        assert unpair({'prim': 'Pair', 'args': [a, b, c]}, 3) == [a, b, c]
+        assert unpair([a, b, c], 3) == [a, b, c]
+        assert unpair({'prim': 'Pair', 'args': [a, [b, c]]}, 3) == [a, b, c]
+
+    def test_should_decode_kernel_governance_storage(self) -> None:
+        baker = self.bootstrap_baker()
+        rollup_mock = self.deploy_rollup_mock()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 2
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        storage = governance.get_storage()
+        assert storage.config == Config(governance_started_at_level, 2, 60, 20, 100, 20, 20, 20)
+        assert storage.voting_context == None
+        assert storage.last_winner == None
+        big_map_ids = [storage.proposals, storage.upvoters_proposals, storage.payloads, storage.voters, storage.metadata]
+        assert len(set(big_map_ids)) == 5
+
+        kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        # Period index: 0. Block: 2 of 2
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_block()
+
+        storage = governance.get_storage()
+        assert storage.voting_context.period_index == 0
+        assert storage.voting_context.period == ProposalPeriod(
+            DEFAULT_VOTING_POWER,
+            kernel_root_hash,
+            DEFAULT_TOTAL_VOTING_POWER,
+        )
+
+        # Period index: 1. Block: 2 of 2
+        self.bake_block()
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_block()
+
+        storage = governance.get_storage()
+        assert storage.voting_context.period_index == 1
+        assert storage.voting_context.period == PromotionPeriod(
+            DEFAULT_VOTING_POWER,
+            0,
+            0,
+            DEFAULT_TOTAL_VOTING_POWER,
+            kernel_root_hash,
+        )
+
+        # Period index: 2. Block: 1 of 2
+        governance.using(baker).trigger_kernel_upgrade(rollup_mock.contract.address).send()
+        self.bake_block()
+
+        storage = governance.get_storage()
+        assert storage.last_winner.payload == kernel_root_hash
+        assert storage.last_winner.payload_prefix == bytes.fromhex(f'eba1{kernel_root_hash.hex()}88')
+        assert storage.last_winner.trigger_history not in big_map_ids
+        # the big maps are preserved by id
+        assert [storage.proposals, storage.upvoters_proposals, storage.payloads, storage.voters, storage.metadata] == big_map_ids
+
+        # the same storage decoded from the optimized Micheline
+        raw_storage = governance.client.shell.head.context.contracts[governance.address].storage.normalized.post({
+            'unparsing_mode': 'Optimized',
+        })
+        assert decode_kernel_governance_storage(raw_storage) == storage
+
+
+class CommitteeStorageDecoderTestCase(BaseTestCase):
+    def test_should_decode_sequencer_governance_storage(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_sequencer_governance()
+
+        sequencer_pk = 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X'
+        pool_address = 'B7A97043983f24991398E5a82f63F4C58a417185'
+        governance.using(baker).new_proposal(sequencer_pk, pool_address).send()
+        self.bake_block()
+
+        storage = governance.get_storage()
+        assert storage.voting_context.period.winner_candidate == SequencerPayload(
+            sequencer_pk,
+            bytes.fromhex(pool_address),
+        )
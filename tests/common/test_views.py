@@ -0,0 +1,155 @@
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import YEA_VOTE
+from tests.helpers.utility import DEFAULT_VOTING_POWER
+import re
+
+class KernelGovernanceViewsTestCase(BaseTestCase):
+    def test_should_return_proposal_and_upvoter_info_of_current_period(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 3
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 3,
+            'upvoting_limit': 2,
+        })
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        assert governance.get_proposal(kernel_root_hash) == None
+        assert governance.get_upvoter_info(baker1.key.public_key_hash()) == {
+            'upvoted_proposals': [],
+            'remaining_upvotes': 2,
+        }
+
+        # Period index: 0. Block: 2 of 3
+        governance.using(baker1).new_proposal(kernel_root_hash).send()
+        governance.using(baker2).upvote_proposal(kernel_root_hash).send()
+        self.bake_block()
+
+        assert governance.get_proposal(kernel_root_hash) == {
+            'proposer': baker1.key.public_key_hash(),
+            'upvotes_voting_power': DEFAULT_VOTING_POWER * 2,
+        }
+        assert governance.get_upvoter_info(baker1.key.public_key_hash()) == {
+            'upvoted_proposals': [kernel_root_hash],
+            'remaining_upvotes': 1,
+        }
+
+        # Period index: 1. Block: 1 of 3
+        self.bake_blocks(2)
+        assert governance.get_proposal(kernel_root_hash) == None
+        assert governance.get_upvoter_info(baker1.key.public_key_hash()) == {
+            'upvoted_proposals': [],
+            'remaining_upvotes': 2,
+        }
+
+    def test_should_return_ballot_last_winner_and_trigger_history(self) -> None:
+        baker = self.bootstrap_baker()
+        rollup_mock1 = self.deploy_rollup_mock()
+        rollup_mock2 = self.deploy_rollup_mock()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 2
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        # Period index: 0. Block: 2 of 2
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_blocks(2)
+
+        # Period index: 1. Block: 2 of 2
+        assert governance.get_ballot(baker.key.public_key_hash()) == None
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_block()
+        assert governance.get_ballot(baker.key.public_key_hash()) == YEA_VOTE
+        assert governance.get_last_winner() == None
+
+        # Period index: 2. Block: 1 of 2. The transition is not stored yet
+        self.bake_block()
+        assert governance.contract.storage()['last_winner'] == None
+        assert governance.get_last_winner() == kernel_root_hash
+        assert governance.get_ballot(baker.key.public_key_hash()) == None
+        assert governance.is_triggered(rollup_mock1.contract.address) == False
+
+        governance.using(baker).trigger_kernel_upgrade(rollup_mock1.contract.address).send()
+        self.bake_block()
+        assert governance.is_triggered(rollup_mock1.contract.address) == True
+        assert governance.is_triggered(rollup_mock2.contract.address) == False
+
+    def test_should_return_upgrade_payload_of_last_winner(self) -> None:
+        baker = self.bootstrap_baker()
+        rollup_mock = self.deploy_rollup_mock()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+        assert governance.get_upgrade_payload() == None
+
+        kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_blocks(2)
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_blocks(2)
+
+        payload_pattern = rf'^EBA1{kernel_root_hash.hex()}88[\da-f]{{16}}$'
+        assert re.match(payload_pattern, governance.get_upgrade_payload().hex(), re.IGNORECASE)
+
+        governance.using(baker).trigger_kernel_upgrade(rollup_mock.contract.address).send()
+        self.bake_block()
+        # only the activation timestamp differs from the sent payload
+        assert governance.get_upgrade_payload()[:-8] == rollup_mock.contract.storage()[:-8]
+
+
+class CommitteeGovernanceViewsTestCase(BaseTestCase):
+    def test_should_return_proposal_by_payload(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_sequencer_governance()
+
+        sequencer_pk = 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X'
+        pool_address = 'B7A97043983f24991398E5a82f63F4C58a417185'
+        assert governance.get_proposal(sequencer_pk, pool_address) == None
+
+        governance.using(baker).new_proposal(sequencer_pk, pool_address).send()
+        self.bake_block()
+
+        assert governance.get_proposal(sequencer_pk, pool_address) == {
+            'proposer': baker.key.public_key_hash(),
+            'upvotes_voting_power': DEFAULT_VOTING_POWER,
+        }
+        assert governance.get_upvoter_info(baker.key.public_key_hash())['upvoted_proposals'] == [
+            governance.get_proposal_key(sequencer_pk, pool_address)
+        ]
+
+    def test_should_return_upgrade_payload_of_last_winner(self) -> None:
+        baker = self.bootstrap_baker()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_sequencer_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+        assert governance.get_upgrade_payload() == None
+
+        sequencer_pk = 'edpkuBknW28nW72KG6RoHtYW7p12T6GKc7nAbwYX5m8Wd9sDVC9yav'
+        pool_address = '71c7656ec7ab88b098defb751b7401b5f6d8976f'
+        governance.using(baker).new_proposal(sequencer_pk, pool_address).send()
+        self.bake_blocks(2)
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_blocks(2)
+
+        payload_pattern = rf'^F855B6{sequencer_pk.encode().hex()}94{pool_address}88[\da-f]{{16}}$'
+        assert re.match(payload_pattern, governance.get_upgrade_payload().hex(), re.IGNORECASE)
@@ -0,0 +1,45 @@
+import tests.common.test_proposal_period as proposal_period
+import tests.common.test_promotion_period as promotion_period
+import tests.sequencer_governance.entrypoints.test_upvote_proposal as sequencer_upvote_proposal
+from dataclasses import asdict
+from tests.helpers.contracts.governance_base import GovernanceBase
+from unittest.mock import patch
+
+run_view = GovernanceBase.get_voting_state
+
+def get_voting_state_checked_locally(governance: GovernanceBase):
+    state = run_view(governance)
+    assert asdict(governance.compute_voting_state()) == state
+    return state
+
+
+class VotingStateConformanceMixin:
+    """Reruns the scenarios of the base test case checking the locally
+    computed voting state against every result of the get_voting_state view"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        patcher = patch.object(GovernanceBase, 'get_voting_state', get_voting_state_checked_locally)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class KernelGovernanceProposalPeriodConformanceTestCase(
+    VotingStateConformanceMixin,
+    proposal_period.KernelGovernanceProposalPeriodTestCase,
+):
+    pass
+
+
+class KernelGovernancePromotionPeriodConformanceTestCase(
+    VotingStateConformanceMixin,
+    promotion_period.KernelGovernancePromotionPeriodTestCase,
+):
+    pass
+
+
+class CommitteeGovernanceUpvoteProposalConformanceTestCase(
+    VotingStateConformanceMixin,
+    sequencer_upvote_proposal.CommitteeGovernanceUpvoteProposalTestCase,
+):
+    pass
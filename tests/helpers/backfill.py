@@ -0,0 +1,181 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pytezos.client import PyTezosClient
+from tests.helpers.contracts.governance_base import NAY_VOTE, YEA_VOTE
+from tests.helpers.indexer import (
+    GovernanceIndexer,
+    decode_event_payload,
+    encode_payload,
+    fetch_block_context,
+    get_governance_operations,
+    get_replayed_calls,
+    has_events,
+)
+from tests.helpers.storage import GovernanceStorage, PromotionPeriod, ProposalPeriod, VotingContext, decode_string
+from tests.helpers.voting_state import PROMOTION_PERIOD, compute_voting_state
+from typing import Any, Callable, Optional
+
+
+class VotingReplay:
+    """Folds the calls of the blocks, decoded from their events or parameters, into the voting context
+    the way the contract does, so the storage before every block is known without requesting it.
+    Only the voting context is folded, it is all compute_voting_state reads"""
+
+    def __init__(self, storage: GovernanceStorage, upvotes: dict[str, int]):
+        self.storage = storage
+        # the upvotes voting power of the proposals of the voting context period, by encoded payload
+        self.upvotes = upvotes
+
+    @classmethod
+    def from_checkpoint(cls, indexer: GovernanceIndexer, client: PyTezosClient, block_id: str) -> 'VotingReplay':
+        """Starts the replay from the storage at given block and the upvotes indexed up to it"""
+
+        storage = indexer.decode_storage(client.shell.blocks[block_id].context.contracts[indexer.contract_address].storage())
+        upvotes = {}
+        if storage.voting_context is not None:
+            upvotes = {
+                payload: upvotes_voting_power
+                for payload, _, upvotes_voting_power in indexer.get_proposals(storage.voting_context.period_index)
+            }
+        return cls(storage, upvotes)
+
+    def move_to_level(self, level: int, total_voting_power: Optional[int]) -> None:
+        """Moves the voting context to the period of given level, as the first call of the period does"""
+
+        voting_state = compute_voting_state(self.storage, level)
+        voting_context = self.storage.voting_context
+        if voting_context is not None and voting_context.period_index == voting_state.period_index:
+            return
+        if total_voting_power is None:
+            raise ValueError(f'The total voting power of the period started at level {level} is unknown')
+        if voting_state.period_type == PROMOTION_PERIOD:
+            period = PromotionPeriod(0, 0, 0, total_voting_power, voting_context.period.winner_candidate)
+        else:
+            period = ProposalPeriod(None, None, total_voting_power)
+        self.storage.voting_context = VotingContext(voting_state.period_index, period)
+        self.upvotes = {}
+
+    def upvote(self, payload: Any, voting_power: int) -> None:
+        period = self.storage.voting_context.period
+        key = encode_payload(payload)
+        upvotes_voting_power = self.upvotes.get(key, 0) + voting_power
+        self.upvotes[key] = upvotes_voting_power
+        if period.max_upvotes_voting_power is None or upvotes_voting_power > period.max_upvotes_voting_power:
+            period.max_upvotes_voting_power = upvotes_voting_power
+            period.winner_candidate = payload
+        elif upvotes_voting_power == period.max_upvotes_voting_power:
+            period.winner_candidate = None
+
+    def vote(self, ballot: str, voting_power: int) -> None:
+        period = self.storage.voting_context.period
+        if ballot == YEA_VOTE:
+            period.yea_voting_power += voting_power
+        elif ballot == NAY_VOTE:
+            period.nay_voting_power += voting_power
+        else:
+            period.pass_voting_power += voting_power
+
+    def apply_block(self, block: dict, indexer: GovernanceIndexer) -> None:
+        level = int(block['header']['level'])
+        context = block.get('governance_context') or {}
+        for call in get_governance_operations(block, indexer.contract_address):
+            if has_events(call):
+                events = [(result['tag'], decode_event_payload(result)) for result in call.emitted if result['kind'] == 'event']
+                total_voting_power = next((event['total_voting_power'] for tag, event in events if tag == 'period_started'), None)
+                self.move_to_level(level, total_voting_power)
+                for tag, event in events:
+                    if tag in ('new_proposal', 'upvote_proposal'):
+                        self.upvote(event['payload'], event['voting_power'])
+                    elif tag == 'vote':
+                        self.vote(event['ballot'], event['voting_power'])
+                continue
+
+            self.move_to_level(level, context.get('total_voting_power'))
+            voting_power = context.get('voting_powers', {}).get(call.sender)
+            if call.entrypoint in ('new_proposal', 'upvote_proposal'):
+                self.upvote(indexer.decode_payload(call.value), voting_power)
+            elif call.entrypoint == 'upvote_proposals':
+                for value in call.value:
+                    self.upvote(indexer.decode_payload(value), voting_power)
+            elif call.entrypoint == 'vote':
+                self.vote(decode_string(call.value), voting_power)
+
+
+def is_sent_to(content: dict, contract_address: str) -> bool:
+    """Checks if the operation content or any of its internal operations is sent to the contract"""
+
+    internal_results = content.get('metadata', {}).get('internal_operation_results', [])
+    return content.get('destination') == contract_address or any(
+        result.get('destination') == contract_address for result in internal_results
+    )
+
+
+def fetch_governance_block(client: PyTezosClient, level: int, contract_address: str) -> Optional[dict]:
+    """Fetches the manager operations of given level and returns the block trimmed
+    to the transactions to the contract (including the internal ones) with the voting powers
+    the calls without events are replayed with, or None if there are no such transactions.
+    The storage is not fetched, it is folded by VotingReplay"""
+
+    block = client.shell.blocks[level]
+    manager_operations = block.operations[3]()
+    governance_operations = [
+        operation for operation in manager_operations
+        if any(is_sent_to(content, contract_address) for content in operation['contents'])
+    ]
+    if not governance_operations:
+        return None
+
+    header = block.header()
+    governance_block = {
+        'hash': header['hash'],
+        'header': {'level': header['level'], 'predecessor': header['predecessor'], 'timestamp': header['timestamp']},
+        'operations': [[], [], [], governance_operations],
+    }
+    governance_block['governance_context'] = fetch_block_context(client, governance_block, contract_address, with_storage=False)
+    return governance_block
+
+
+def backfill(
+    indexer: GovernanceIndexer,
+    client: PyTezosClient,
+    start_level: int,
+    end_level: int,
+    workers: int = 8,
+    chunk_size: int = 100,
+    on_progress: Optional[Callable[[int, float], None]] = None,
+) -> int:
+    """Indexes the level range from start level (or the checkpoint) to end level.
+    The levels of a chunk and the voting powers of their calls without events are fetched by the worker pool
+    concurrently, then the chunk is applied in order by the indexer and committed together with the checkpoint.
+    The storage the calls without events are replayed with is requested once per chunk, at the first such call,
+    and then folded through the following blocks of the chunk. Returns the number of governance operations found"""
+
+    checkpoint = indexer.get_last_indexed_level()
+    level = start_level if checkpoint is None else max(start_level, checkpoint + 1)
+    operations_count = 0
+    started_at = time.perf_counter()
+    blocks_count = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while level <= end_level:
+            chunk_end_level = min(level + chunk_size - 1, end_level)
+            levels = range(level, chunk_end_level + 1)
+            blocks = executor.map(lambda block_level: fetch_governance_block(client, block_level, indexer.contract_address), levels)
+            with indexer.connection:
+                replay: Optional[VotingReplay] = None
+                for block in blocks:
+                    if block is None:
+                        continue
+                    if replay is None and get_replayed_calls(get_governance_operations(block, indexer.contract_address)):
+                        replay = VotingReplay.from_checkpoint(indexer, client, block['header']['predecessor'])
+                    operations_count += indexer.apply_block(block, replay.storage if replay is not None else None)
+                    if replay is not None:
+                        replay.apply_block(block, indexer)
+                indexer.set_checkpoint(chunk_end_level)
+
+            blocks_count += len(levels)
+            level = chunk_end_level + 1
+            if on_progress is not None:
+                on_progress(chunk_end_level, blocks_count / (time.perf_counter() - started_at))
+
+    return operations_count
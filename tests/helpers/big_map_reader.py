@@ -0,0 +1,193 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pytezos.client import PyTezosClient
+from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.types.base import MichelsonType
+from pytezos.rpc.node import RpcNotFoundError
+from tests.helpers.storage import GovernanceStorage, PayloadDecoder, decode_kernel_payload
+from tests.helpers.utility import pack, to_micheline
+from typing import Any, Callable, Hashable, Optional
+
+
+PROPOSALS_KEY_TYPE = 'pair nat bytes'
+PROPOSALS_VALUE_TYPE = 'pair (key_hash %proposer) (nat %upvotes_voting_power)'
+UPVOTERS_PROPOSALS_KEY_TYPE = 'pair nat key_hash'
+UPVOTERS_PROPOSALS_VALUE_TYPE = 'set bytes'
+VOTERS_KEY_TYPE = 'pair nat key_hash'
+VOTERS_VALUE_TYPE = 'or (unit %yea) (or (unit %nay) (unit %pass))'
+PAYLOADS_KEY_TYPE = 'bytes'
+
+
+@dataclass(slots=True)
+class ProposalRecord:
+    proposer: str
+    upvotes_voting_power: int
+
+
+@dataclass(slots=True)
+class PeriodBigMaps:
+    """The big_map entries of one period"""
+
+    period_index: int
+    proposals: dict[bytes, ProposalRecord]
+    upvoters_proposals: dict[str, set[bytes]]
+    ballots: dict[str, str]
+    # the full payloads of the period proposals, empty for the kernel governance
+    payloads: dict[bytes, Any]
+
+
+def get_key_hash(key: Any, key_type: str) -> str:
+    """Returns the script expression hash the big_map value is stored by"""
+
+    return forge_script_expr(pack(key, key_type))
+
+
+def make_value_decoder(value_type: str) -> Callable[[Any], Any]:
+    michelson_type = MichelsonType.match(to_micheline(value_type))
+    return lambda value: michelson_type.from_micheline_value(value).to_python_object()
+
+
+decode_proposal_value = make_value_decoder(PROPOSALS_VALUE_TYPE)
+decode_upvoter_proposals_value = make_value_decoder(UPVOTERS_PROPOSALS_VALUE_TYPE)
+decode_ballot_value = make_value_decoder(VOTERS_VALUE_TYPE)
+
+
+class BigMapReader:
+    """Reads the governance big_maps in bulk with concurrent requests, without any indexed history.
+    The key hashes are listed page by page from the raw context. The keys themselves are not stored
+    by the node, so they are matched by hash with the keys that can be in the period: the delegates
+    of the voting listings for the upvoters and the voters, and the upvoted proposals for the proposals.
+    Entries of the finished periods never change, so they are cached by big_map id and period"""
+
+    def __init__(self, client: PyTezosClient, storage: GovernanceStorage, workers: int = 8, page_size: int = 1000):
+        self.client = client
+        self.storage = storage
+        self.workers = workers
+        self.page_size = page_size
+        self.cache: dict[tuple[int, int], dict] = {}
+
+    def list_key_hashes(self, block_hash: str, big_map_id: int) -> set[str]:
+        """Lists the key hashes of the big_map from the raw context, page by page"""
+
+        contents = self.client.shell.blocks[block_hash].context.raw.json.big_maps.index[big_map_id].contents
+        key_hashes: set[str] = set()
+        offset = 0
+        while True:
+            try:
+                page = contents(offset=offset, length=self.page_size)
+            except RpcNotFoundError:
+                # NOTE: the contents of an empty big_map are not in the context
+                break
+            key_hashes.update(page)
+            if len(page) < self.page_size:
+                break
+            offset += self.page_size
+        return key_hashes
+
+    def fetch_values(
+        self,
+        block_hash: str,
+        big_map_id: int,
+        keys: list[Hashable],
+        key_type: str,
+        decode_value: Callable[[Any], Any],
+        key_hashes: Optional[set[str]] = None,
+    ) -> dict[Hashable, Any]:
+        """Fetches the values of given keys concurrently. Only the keys found in key_hashes
+        are requested if they are given. The keys missing in the big_map are skipped"""
+
+        big_map = self.client.shell.blocks[block_hash].context.big_maps[big_map_id]
+        hashed_keys = [(key, get_key_hash(key, key_type)) for key in keys]
+        if key_hashes is not None:
+            hashed_keys = [(key, key_hash) for key, key_hash in hashed_keys if key_hash in key_hashes]
+
+        def fetch(key_hash: str) -> Optional[Any]:
+            try:
+                return decode_value(big_map[key_hash]())
+            except RpcNotFoundError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            values = list(executor.map(fetch, [key_hash for _, key_hash in hashed_keys]))
+        return {key: value for (key, _), value in zip(hashed_keys, values) if value is not None}
+
+    def read_cached(
+        self,
+        big_map_id: int,
+        period_index: int,
+        finished: bool,
+        read: Callable[[], dict],
+    ) -> dict:
+        cache_key = (big_map_id, period_index)
+        if cache_key in self.cache:
+            return self.cache[cache_key]
+        entries = read()
+        if finished:
+            self.cache[cache_key] = entries
+        return entries
+
+    def get_period_start_level(self, period_index: int) -> int:
+        config = self.storage.config
+        return config.started_at_level + period_index * config.period_length
+
+    def get_period_end_level(self, period_index: int) -> int:
+        return self.get_period_start_level(period_index + 1) - 1
+
+    def get_delegates(self, period_index: int) -> list[str]:
+        """Returns the delegates allowed to upvote and vote in the period.
+        The period doesn't cross the protocol voting periods, so the listings are the same for all its blocks"""
+
+        # NOTE: the operations of a block are applied on the context of the previous block
+        listings = self.client.shell.blocks[self.get_period_start_level(period_index) - 1].votes.listings()
+        return [listing['pkh'] for listing in listings]
+
+    def read_period(
+        self,
+        period_index: int,
+        decode_payload: PayloadDecoder = decode_kernel_payload,
+    ) -> PeriodBigMaps:
+        """Reads the proposals, upvoters, voters and payloads entries of given period at the head block.
+        The payloads are decoded with given function"""
+
+        header = self.client.shell.head.header()
+        block_hash = header['hash']
+        finished = int(header['level']) >= self.get_period_end_level(period_index)
+        storage = self.storage
+        cache_keys = [(big_map_id, period_index) for big_map_id in (storage.proposals, storage.upvoters_proposals, storage.voters, storage.payloads)]
+        delegates = [] if all(key in self.cache for key in cache_keys) else self.get_delegates(period_index)
+
+        def read_upvoters_proposals():
+            keys = [(period_index, delegate) for delegate in delegates]
+            key_hashes = self.list_key_hashes(block_hash, storage.upvoters_proposals)
+            values = self.fetch_values(block_hash, storage.upvoters_proposals, keys, UPVOTERS_PROPOSALS_KEY_TYPE, decode_upvoter_proposals_value, key_hashes)
+            return {upvoter: set(value) for (_, upvoter), value in values.items()}
+
+        upvoters_proposals = self.read_cached(storage.upvoters_proposals, period_index, finished, read_upvoters_proposals)
+        # NOTE: every proposal is upvoted by its proposer, so the upvoted proposals are all the proposals of the period
+        proposal_keys = sorted(set().union(*upvoters_proposals.values()))
+
+        def read_proposals():
+            keys = [(period_index, proposal_key) for proposal_key in proposal_keys]
+            values = self.fetch_values(block_hash, storage.proposals, keys, PROPOSALS_KEY_TYPE, decode_proposal_value)
+            return {
+                proposal_key: ProposalRecord(value['proposer'], value['upvotes_voting_power'])
+                for (_, proposal_key), value in values.items()
+            }
+
+        def read_ballots():
+            keys = [(period_index, delegate) for delegate in delegates]
+            key_hashes = self.list_key_hashes(block_hash, storage.voters)
+            values = self.fetch_values(block_hash, storage.voters, keys, VOTERS_KEY_TYPE, decode_ballot_value, key_hashes)
+            return {voter: value for (_, voter), value in values.items()}
+
+        def read_payloads():
+            key_hashes = self.list_key_hashes(block_hash, storage.payloads)
+            return self.fetch_values(block_hash, storage.payloads, proposal_keys, PAYLOADS_KEY_TYPE, decode_payload, key_hashes)
+
+        return PeriodBigMaps(
+            period_index,
+            self.read_cached(storage.proposals, period_index, finished, read_proposals),
+            upvoters_proposals,
+            self.read_cached(storage.voters, period_index, finished, read_ballots),
+            self.read_cached(storage.payloads, period_index, finished, read_payloads),
+        )
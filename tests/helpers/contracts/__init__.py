@@ -1,5 +1,6 @@
 from tests.helpers.contracts.kernel_governance import KernelGovernance
 from tests.helpers.contracts.sequencer_governance import SequencerGovernance
+from tests.helpers.contracts.multi_track_kernel_governance import MultiTrackKernelGovernance
 from tests.helpers.contracts.rollup_mock import RollupMock
 from tests.helpers.contracts.internal_test_proxy import InternalTestProxy
 from tests.helpers.contracts.contract import ContractHelper
@@ -12,6 +13,7 @@ __all__ = [
     'ContractHelper',
     'GovernanceBase',
     'SequencerGovernance',
+    'MultiTrackKernelGovernance',
     'RollupMock',
     'InternalTestProxy',
 ]
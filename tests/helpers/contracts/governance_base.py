@@ -1,16 +1,25 @@
+from abc import abstractmethod
+from dataclasses import dataclass
 from tests.helpers.contracts.contract import ContractHelper
+from tests.helpers.head_cache import HeadCache
+from tests.helpers.storage import GovernanceStorage
+from tests.helpers.voting_state import PROMOTION_PERIOD, PROPOSAL_PERIOD, VotingState, compute_voting_state
 from typing import (
     Any,
+    Callable,
+    Hashable,
+    Optional,
 )
 
-PROPOSAL_PERIOD = 'proposal'
-PROMOTION_PERIOD = 'promotion'
-
 YEA_VOTE = 'yea'
 NAY_VOTE = 'nay'
 PASS_VOTE = 'pass'
 
+@dataclass
 class GovernanceBase(ContractHelper):
+    # NOTE: every read compares the node head hash with the cached one, so the cached reads are dropped on a new head
+    cache: Optional[HeadCache] = None
+
     @staticmethod
     def make_storage(metadata: dict[str, Any], custom_config=None, last_winner=None) -> dict[str, Any]:
         config = {
@@ -31,8 +40,76 @@ class GovernanceBase(ContractHelper):
             'config': config,
             'voting_context': None,
             'last_winner': last_winner,
+            'proposals': {},
+            'upvoters_proposals': {},
+            'voters': {},
+            'payloads': {},
             'metadata': metadata
         }
     
     def get_voting_state(self):
-        return self.contract.get_voting_state().run_view()
\ No newline at end of file
+        return self.run_view('get_voting_state')
+
+    def compute_voting_state(self) -> VotingState:
+        """Returns the same state as the get_voting_state view, computed locally
+        from the storage and the level of the head block"""
+
+        block_hash, level = self.get_head()
+        return self.read(block_hash, 'voting_state', lambda: compute_voting_state(self.get_storage(block_hash), level))
+
+    def get_upvoter_info(self, upvoter : str):
+        return self.run_view('get_upvoter_info', upvoter)
+
+    def get_ballot(self, voter : str):
+        return self.run_view('get_ballot', voter)
+
+    def get_last_winner(self):
+        return self.run_view('get_last_winner')
+
+    def is_triggered(self, rollup_address : str):
+        return self.run_view('is_triggered', rollup_address)
+
+    def get_upgrade_payload(self):
+        return self.run_view('get_upgrade_payload')
+
+    def get_head(self) -> tuple[str, int]:
+        """Returns the hash and the level of the head block. The cache is moved to the head if it is set"""
+
+        if self.cache is None:
+            header = self.client.shell.head.header()
+            return header['hash'], int(header['level'])
+        self.cache.refresh_head(self.client)
+        return self.cache.head_hash, self.cache.head_level
+
+    def read(self, block_id: str, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Fetches a value at given block, through the cache if it is set"""
+
+        if self.cache is None:
+            return fetch()
+        return self.cache.get(self.address, block_id, key, fetch)
+
+    def run_view(self, name: str, *args: Any) -> Any:
+        """Runs the on-chain view at the head block"""
+
+        if self.cache is None:
+            return getattr(self.contract, name)(*args).run_view()
+        block_hash, _ = self.get_head()
+        fetch = lambda: getattr(self.contract.using(block_id=block_hash), name)(*args).run_view()
+        return self.read(block_hash, (name, *args), fetch)
+
+    def get_raw_storage(self, block_id='head') -> Any:
+        """Returns the Micheline storage of the contract at given block"""
+
+        return self.client.shell.blocks[block_id].context.contracts[self.address].storage()
+
+    def get_storage(self, block_id='head') -> GovernanceStorage:
+        """Returns the typed storage of the contract at given block"""
+
+        if self.cache is not None and block_id == 'head':
+            block_id, _ = self.get_head()
+        return self.read(block_id, 'storage', lambda: self.decode_storage(self.get_raw_storage(block_id)))
+
+    @staticmethod
+    @abstractmethod
+    def decode_storage(raw_storage: Any) -> GovernanceStorage:
+        """Decodes the Micheline storage with the payload type of the contract"""
\ No newline at end of file
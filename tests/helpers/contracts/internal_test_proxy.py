@@ -5,6 +5,7 @@ from tests.helpers.utility import (
     originate_from_file,
 )
 from pytezos.operation.group import OperationGroup
+from pytezos.contract.call import ContractCall
 from os.path import join
 
 
@@ -23,4 +24,9 @@ class InternalTestProxy(ContractHelper):
         return self.contract.get_sequencer_upgrade_payload(sequencer_pk, pool_address, activation_timestamp).run_view()
     
     def address_to_key_hash(self, address : str):
-        return self.contract.address_to_key_hash(address).run_view()
\ No newline at end of file
+        return self.contract.address_to_key_hash(address).run_view()
+    
+    def call_get_voting_state(self, governance_address : str) -> ContractCall:
+        """Calls get_voting_state view of the governance contract on-chain"""
+
+        return self.contract.call_get_voting_state(governance_address)
\ No newline at end of file
@@ -8,6 +8,7 @@ from pytezos.operation.group import OperationGroup
 from pytezos.contract.call import ContractCall
 from os.path import join
 from tests.helpers.metadata import Metadata
+from tests.helpers.storage import GovernanceStorage, decode_kernel_governance_storage
 
 
 class KernelGovernance(GovernanceBase):
@@ -21,12 +22,21 @@ class KernelGovernance(GovernanceBase):
         filename = join(get_build_dir(), 'kernel_governance.tz')
 
         return originate_from_file(filename, client, storage)
+
+    @staticmethod
+    def decode_storage(raw_storage) -> GovernanceStorage[bytes]:
+        return decode_kernel_governance_storage(raw_storage)
     
 
     def trigger_kernel_upgrade(self, rollup_address : str) -> ContractCall:
         """Triggers kernel upgrade transaction to rollup with last winner kernel hash"""
 
         return self.contract.trigger_kernel_upgrade(rollup_address)
+
+    def trigger_kernel_upgrades(self, rollup_addresses : list[str]) -> ContractCall:
+        """Triggers kernel upgrade transactions to rollups with last winner kernel hash"""
+
+        return self.contract.trigger_kernel_upgrades(rollup_addresses)
     
     
     def new_proposal(self, kernel_root_hash : bytes) -> ContractCall:
@@ -40,7 +50,20 @@ class KernelGovernance(GovernanceBase):
 
         return self.contract.upvote_proposal(kernel_root_hash)
     
+    def upvote_proposals(self, kernel_root_hashes : list[bytes]) -> ContractCall:
+        """Upvotes several exist proposals in one transaction"""
+
+        return self.contract.upvote_proposals(kernel_root_hashes)
+    
     def vote(self, vote : str) -> ContractCall:
         """Votes for a kernel_root_hash in promotion period"""
 
-        return self.contract.vote(vote)
\ No newline at end of file
+        return self.contract.vote(vote)
+
+    def advance_period(self) -> ContractCall:
+        """Moves the voting context to the current period"""
+
+        return self.contract.advance_period()
+
+    def get_proposal(self, kernel_root_hash : bytes):
+        return self.run_view('get_proposal', kernel_root_hash)
\ No newline at end of file
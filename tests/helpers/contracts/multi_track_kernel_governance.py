@@ -0,0 +1,91 @@
+from pytezos.client import PyTezosClient
+from tests.helpers.contracts.contract import ContractHelper
+from tests.helpers.contracts.governance_base import GovernanceBase
+from tests.helpers.utility import (
+    get_build_dir,
+    originate_from_file,
+)
+from pytezos.operation.group import OperationGroup
+from pytezos.contract.call import ContractCall
+from os.path import join
+from tests.helpers.metadata import Metadata
+from tests.helpers.storage import MultiTrackGovernanceStorage, decode_multi_track_kernel_governance_storage
+from typing import Any
+
+REGULAR_TRACK = 'regular'
+SECURITY_TRACK = 'security'
+
+class MultiTrackKernelGovernance(ContractHelper):
+    @staticmethod
+    def make_storage(metadata: dict[str, Any], custom_configs=None) -> dict[str, Any]:
+        custom_configs = custom_configs if custom_configs != None else {
+            REGULAR_TRACK: None,
+            SECURITY_TRACK: None,
+        }
+        # NOTE: the tracks don't have their own metadata, it is unit in the track storage
+        return {
+            'tracks': {
+                track: GovernanceBase.make_storage(None, custom_config=custom_config)
+                for track, custom_config in custom_configs.items()
+            },
+            'metadata': metadata
+        }
+
+    @classmethod
+    def originate(self, client: PyTezosClient, custom_configs=None, metadata=None) -> OperationGroup:
+        """Deploys Multi-Track Kernel Governance"""
+
+        metadata = metadata if metadata != None else dict()
+        metadata = Metadata.make_default(**metadata)
+        storage = self.make_storage(metadata, custom_configs=custom_configs)
+        filename = join(get_build_dir(), 'multi_track_kernel_governance.tz')
+
+        return originate_from_file(filename, client, storage)
+    
+
+    def new_proposal(self, track : str, kernel_root_hash : bytes) -> ContractCall:
+        """Creates a new proposal in the track"""
+
+        return self.contract.new_proposal(track, kernel_root_hash)
+    
+    def upvote_proposal(self, track : str, kernel_root_hash : bytes) -> ContractCall:
+        """Upvotes an exist proposal in the track"""
+
+        return self.contract.upvote_proposal(track, kernel_root_hash)
+    
+    def upvote_proposals(self, track : str, kernel_root_hashes : list[bytes]) -> ContractCall:
+        """Upvotes several exist proposals of the track in one transaction"""
+
+        return self.contract.upvote_proposals(track, kernel_root_hashes)
+    
+    def vote(self, track : str, vote : str) -> ContractCall:
+        """Votes for a kernel_root_hash in promotion period of the track"""
+
+        return self.contract.vote(track, vote)
+
+    def advance_period(self, track : str) -> ContractCall:
+        """Moves the voting context of the track to the current period"""
+
+        return self.contract.advance_period(track)
+
+    def trigger_kernel_upgrade(self, track : str, rollup_address : str) -> ContractCall:
+        """Triggers kernel upgrade transaction to rollup with last winner kernel hash of the track"""
+
+        return self.contract.trigger_kernel_upgrade(track, rollup_address)
+
+    def trigger_kernel_upgrades(self, track : str, rollup_addresses : list[str]) -> ContractCall:
+        """Triggers kernel upgrade transactions to rollups with last winner kernel hash of the track"""
+
+        return self.contract.trigger_kernel_upgrades(track, rollup_addresses)
+    
+    def get_voting_state(self, track : str):
+        return self.contract.get_voting_state(track).run_view()
+
+    def get_last_winner(self, track : str):
+        return self.contract.get_last_winner(track).run_view()
+
+    def get_storage(self) -> MultiTrackGovernanceStorage:
+        """Returns the typed storage of the contract at the head block"""
+
+        raw_storage = self.client.shell.head.context.contracts[self.address].storage()
+        return decode_multi_track_kernel_governance_storage(raw_storage)
@@ -3,11 +3,14 @@ from tests.helpers.contracts.governance_base import GovernanceBase
 from tests.helpers.utility import (
     get_build_dir,
     originate_from_file,
+    pack,
 )
 from pytezos.operation.group import OperationGroup
 from pytezos.contract.call import ContractCall
 from os.path import join
+from hashlib import blake2b
 from tests.helpers.metadata import Metadata
+from tests.helpers.storage import GovernanceStorage, SequencerPayload, decode_sequencer_governance_storage
 
 
 class SequencerGovernance(GovernanceBase):
@@ -21,7 +24,22 @@ class SequencerGovernance(GovernanceBase):
         filename = join(get_build_dir(), 'sequencer_governance.tz')
 
         return originate_from_file(filename, client, storage)
+
+    @staticmethod
+    def decode_storage(raw_storage) -> GovernanceStorage[SequencerPayload]:
+        return decode_sequencer_governance_storage(raw_storage)
     
+    @staticmethod
+    def get_proposal_key(sequencer_pk : str, pool_address : str) -> bytes:
+        """Returns the hash the proposal is stored by in the contract"""
+
+        payload = {
+            'sequencer_pk': sequencer_pk,
+            'pool_address': bytes.fromhex(pool_address),
+        }
+        packed_payload = pack(payload, 'pair (string %sequencer_pk) (bytes %pool_address)')
+        return blake2b(packed_payload, digest_size=32).digest()
+
     def new_proposal(self, sequencer_pk : str, pool_address : bytes) -> ContractCall:
         """Creates a new proposal"""
 
@@ -33,12 +51,30 @@ class SequencerGovernance(GovernanceBase):
 
         return self.contract.upvote_proposal(sequencer_pk, pool_address)
     
+    def upvote_proposals(self, payloads : list[dict]) -> ContractCall:
+        """Upvotes several exist proposals in one transaction"""
+
+        return self.contract.upvote_proposals(payloads)
+    
     def vote(self, vote : str) -> ContractCall:
         """Votes for a hash in promotion period"""
 
         return self.contract.vote(vote)
 
+    def advance_period(self) -> ContractCall:
+        """Moves the voting context to the current period"""
+
+        return self.contract.advance_period()
+
     def trigger_committee_upgrade(self, rollup_address : str) -> ContractCall:
         """Triggers upgrade transaction to rollup with last winner committee addresses set"""
 
         return self.contract.trigger_committee_upgrade(rollup_address)
+
+    def trigger_committee_upgrades(self, rollup_addresses : list[str]) -> ContractCall:
+        """Triggers upgrade transactions to rollups with last winner committee addresses set"""
+
+        return self.contract.trigger_committee_upgrades(rollup_addresses)
+
+    def get_proposal(self, sequencer_pk : str, pool_address : str):
+        return self.run_view('get_proposal', sequencer_pk, pool_address)
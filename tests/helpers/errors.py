@@ -13,4 +13,10 @@ INCORRECT_KERNEL_ROOT_HASH_LENGTH = 'INCORRECT_KERNEL_ROOT_HASH_LENGTH'
 UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED = 'UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED'
 INCORRECT_SEQUENCER_PK_LENGTH = 'INCORRECT_SEQUENCER_PK_LENGTH'
 INCORRECT_POOL_ADDRESS_LENGTH = 'INCORRECT_POOL_ADDRESS_LENGTH'
-NOT_IMPLICIT_ADDRESS = 'NOT_IMPLICIT_ADDRESS'
\ No newline at end of file
+NOT_IMPLICIT_ADDRESS = 'NOT_IMPLICIT_ADDRESS'
+VALUE_EXCEEDS_UINT64 = 'VALUE_EXCEEDS_UINT64'
+PROPOSAL_NOT_FOUND = 'PROPOSAL_NOT_FOUND'
+TRACK_NOT_FOUND = 'TRACK_NOT_FOUND'
+CURRENT_LEVEL_LESS_THAN_START_LEVEL = 'CURRENT_LEVEL_LESS_THAN_START_LEVEL'
+NO_PROPOSALS_TO_UPVOTE = 'NO_PROPOSALS_TO_UPVOTE'
+NO_ROLLUPS_TO_UPGRADE = 'NO_ROLLUPS_TO_UPGRADE'
\ No newline at end of file
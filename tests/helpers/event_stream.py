@@ -0,0 +1,169 @@
+import asyncio
+import json
+import requests
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pytezos.client import PyTezosClient
+from tests.helpers.indexer import decode_event_payload, get_governance_operations
+from typing import AsyncIterator, Callable, Iterator, Optional, Union
+from urllib3.exceptions import ReadTimeoutError
+
+
+@dataclass(slots=True)
+class GovernanceEvent:
+    """A contract event (voting_finished, period_started, new_proposal, upvote_proposal, vote)
+    or an upgrade trigger included in a block"""
+
+    kind: str
+    level: int
+    block_hash: str
+    block_timestamp: datetime
+    op_hash: str
+    data: dict
+
+
+@dataclass(slots=True)
+class Rollback:
+    """The events of this level and above were delivered from the blocks reorganized out of the chain"""
+
+    level: int
+
+
+StreamItem = Union[GovernanceEvent, Rollback]
+
+
+def parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def decode_block_events(block: dict, contract_address: str) -> list[GovernanceEvent]:
+    """Decodes the events and the upgrade triggers of the contract in given block"""
+
+    level = int(block['header']['level'])
+    block_timestamp = parse_timestamp(block['header']['timestamp'])
+    events = []
+    for call in get_governance_operations(block, contract_address):
+        for result in call.emitted:
+            if result['kind'] == 'event':
+                data = decode_event_payload(result)
+                events.append(GovernanceEvent(result['tag'], level, block['hash'], block_timestamp, call.op_hash, data))
+            elif result['kind'] == 'transaction':
+                data = {
+                    'rollup_address': result['destination'],
+                    'entrypoint': call.entrypoint,
+                }
+                events.append(GovernanceEvent('trigger', level, block['hash'], block_timestamp, call.op_hash, data))
+    return events
+
+
+class ChainFollower:
+    """Keeps the hashes of the recent blocks to find the blocks to apply for a new head.
+    Fills the level gaps and detects reorganizations up to given depth"""
+
+    def __init__(self, fetch_block: Callable[[str], dict], max_reorg_depth: int = 10):
+        self.fetch_block = fetch_block
+        self.max_reorg_depth = max_reorg_depth
+        self.recent_hashes: dict[int, str] = {}
+
+    def apply_head(self, head_hash: str) -> tuple[Optional[int], list[dict]]:
+        """Returns the level the chain was reorganized from (if any)
+        and the new blocks up to given head in level order"""
+
+        if head_hash in self.recent_hashes.values():
+            return None, []
+
+        new_blocks = [self.fetch_block(head_hash)]
+        while self.recent_hashes:
+            block = new_blocks[0]
+            level = int(block['header']['level'])
+            predecessor = block['header']['predecessor']
+            if self.recent_hashes.get(level - 1) == predecessor or level - 1 < min(self.recent_hashes):
+                break
+            new_blocks.insert(0, self.fetch_block(predecessor))
+
+        first_level = int(new_blocks[0]['header']['level'])
+        reorganized_levels = [level for level in self.recent_hashes if level >= first_level]
+        for level in reorganized_levels:
+            del self.recent_hashes[level]
+        for block in new_blocks:
+            self.recent_hashes[int(block['header']['level'])] = block['hash']
+        for level in sorted(self.recent_hashes)[:-self.max_reorg_depth]:
+            del self.recent_hashes[level]
+
+        return (first_level if reorganized_levels else None), new_blocks
+
+
+def monitor_heads(rpc_url: str, session: requests.Session, read_timeout: Optional[float] = None) -> Iterator[dict]:
+    """Yields the new head headers from the node head monitor stream.
+    Returns when no head is received for read_timeout seconds"""
+
+    try:
+        with session.get(f'{rpc_url.rstrip("/")}/monitor/heads/main', stream=True, timeout=read_timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+    except requests.exceptions.ReadTimeout:
+        return
+    except requests.exceptions.ConnectionError as error:
+        # NOTE: the read timeouts of the response body are raised as connection errors
+        if not isinstance(error.args[0], ReadTimeoutError):
+            raise
+
+
+async def stream_governance_events(
+    client: PyTezosClient,
+    contract_address: str,
+    queue_size: int = 16,
+    max_reorg_depth: int = 10,
+    stop_check_interval: float = 5,
+    connected: Optional[asyncio.Event] = None,
+) -> AsyncIterator[StreamItem]:
+    """Yields the governance events of the new blocks as they are included.
+    The head monitor stream is read by a thread into a bounded queue. The oldest head is dropped
+    when the consumer is behind and the queue is full, the skipped blocks are fetched from the next head.
+    The monitor is reopened every stop_check_interval seconds without heads to check if the stream is closed.
+    Given connected event is set once the first head is received"""
+
+    loop = asyncio.get_running_loop()
+    heads: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    session = requests.Session()
+    stopped = threading.Event()
+
+    def put_head(item: Union[dict, Exception]) -> None:
+        if heads.full():
+            heads.get_nowait()
+        heads.put_nowait(item)
+        if connected is not None:
+            connected.set()
+
+    def read_heads():
+        try:
+            while not stopped.is_set():
+                for header in monitor_heads(client.shell.node.uri[0], session, stop_check_interval):
+                    if stopped.is_set():
+                        return
+                    loop.call_soon_threadsafe(put_head, header)
+        except Exception as error:
+            if not stopped.is_set():
+                loop.call_soon_threadsafe(put_head, error)
+
+    reader = threading.Thread(target=read_heads, daemon=True)
+    reader.start()
+    follower = ChainFollower(lambda block_hash: client.shell.blocks[block_hash](), max_reorg_depth)
+    try:
+        while True:
+            header = await heads.get()
+            if isinstance(header, Exception):
+                raise header
+            reorganized_level, blocks = await asyncio.to_thread(follower.apply_head, header['hash'])
+            if reorganized_level is not None:
+                yield Rollback(reorganized_level)
+            for block in blocks:
+                for event in decode_block_events(block, contract_address):
+                    yield event
+    finally:
+        stopped.set()
+        await asyncio.to_thread(reader.join)
+        session.close()
@@ -0,0 +1,148 @@
+import asyncio
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from tests.helpers.storage import (
+    GovernanceStorage,
+    ProposalPeriod,
+    SequencerPayload,
+    decode_kernel_governance_storage,
+    decode_sequencer_governance_storage,
+)
+from tests.helpers.voting_state import PROMOTION_PERIOD, VotingState, compute_voting_state, get_proposal_winner
+from typing import Any, Optional, Union
+
+
+STORAGE_DECODERS = {
+    'kernel': decode_kernel_governance_storage,
+    'sequencer': decode_sequencer_governance_storage,
+}
+
+
+@dataclass(slots=True)
+class MonitoredContract:
+    """A governance contract of a network. The kind is `kernel` (regular and security
+    kernel governance) or `sequencer`"""
+
+    name: str
+    kind: str
+    address: str
+    rpc_url: str
+
+
+@dataclass(slots=True)
+class GovernanceSummary:
+    """The voting state of a contract with the leading payload of the current period.
+    The leader voting power is the max upvotes in a proposal period and the yea votes in a promotion period.
+    The quorum progress is the voted share of the quorum, 1 when the quorum is reached"""
+
+    contract: MonitoredContract
+    level: int
+    voting_state: VotingState
+    leader: Optional[Any]
+    leader_voting_power: Optional[int]
+    quorum_progress: float
+
+
+def summarize(contract: MonitoredContract, storage: GovernanceStorage, level: int) -> GovernanceSummary:
+    """Makes the summary of the contract storage at given level"""
+
+    config = storage.config
+    voting_state = compute_voting_state(storage, level)
+    voting_context = storage.voting_context
+    leader, leader_voting_power, quorum_progress = None, None, 0.0
+    if voting_context is not None:
+        period = voting_context.period
+        if voting_context.period_index == voting_state.period_index:
+            if isinstance(period, ProposalPeriod):
+                leader, leader_voting_power = period.winner_candidate, period.max_upvotes_voting_power
+                voted_voting_power, quorum = period.max_upvotes_voting_power or 0, config.proposal_quorum
+            else:
+                leader, leader_voting_power = period.winner_candidate, period.yea_voting_power
+                voted_voting_power = period.yea_voting_power + period.nay_voting_power + period.pass_voting_power
+                quorum = config.promotion_quorum
+            quorum_voting_power = quorum * period.total_voting_power
+            quorum_progress = voted_voting_power * config.scale / quorum_voting_power if quorum_voting_power else 1.0
+        elif voting_state.period_type == PROMOTION_PERIOD:
+            # NOTE: the promotion period has no ballots yet, the candidate is the winner of the last proposal period
+            leader = get_proposal_winner(period, config)
+    return GovernanceSummary(contract, level, voting_state, leader, leader_voting_power, quorum_progress)
+
+
+def format_payload(payload: Optional[Any]) -> str:
+    if payload is None:
+        return '-'
+    if isinstance(payload, SequencerPayload):
+        return f'{payload.sequencer_pk} {payload.pool_address.hex()}'
+    return payload.hex()
+
+
+def render_table(rows: list[Union[GovernanceSummary, Exception]], contracts: list[MonitoredContract]) -> str:
+    """Renders the summaries (or the errors of their refresh) as a text table"""
+
+    header = ('contract', 'level', 'period', 'type', 'remaining', 'leader', 'leader power', 'quorum')
+    lines = [header]
+    for contract, row in zip(contracts, rows):
+        if isinstance(row, Exception):
+            lines.append((contract.name, '-', '-', '-', '-', f'error: {row}', '-', '-'))
+            continue
+        state = row.voting_state
+        lines.append((
+            contract.name,
+            str(row.level),
+            str(state.period_index),
+            state.period_type,
+            str(state.remaining_blocks),
+            format_payload(row.leader),
+            '-' if row.leader_voting_power is None else str(row.leader_voting_power),
+            f'{min(row.quorum_progress, 1):.0%}',
+        ))
+    widths = [max(len(line[column]) for line in lines) for column in range(len(header))]
+    return '\n'.join('  '.join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() for line in lines)
+
+
+class GovernanceMonitor:
+    """Refreshes the summaries of many contracts concurrently. The requests share one
+    connection pool, the heads of all networks are requested at once and then the storages
+    of all contracts at their network heads, so a refresh takes two round trips for any number of contracts"""
+
+    def __init__(self, contracts: list[MonitoredContract], workers: int = 16, timeout: float = 10):
+        self.contracts = contracts
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len({contract.rpc_url for contract in contracts}), pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def get(self, rpc_url: str, path: str) -> Any:
+        response = self.session.get(f'{rpc_url.rstrip("/")}/{path}', timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch(self, rpc_url: str, path: str) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.get, rpc_url, path)
+
+    async def refresh_contract(self, contract: MonitoredContract, head: asyncio.Future) -> GovernanceSummary:
+        header = await head
+        path = f'chains/main/blocks/{header["hash"]}/context/contracts/{contract.address}/storage'
+        storage = STORAGE_DECODERS[contract.kind](await self.fetch(contract.rpc_url, path))
+        return summarize(contract, storage, int(header['level']))
+
+    async def refresh(self) -> list[Union[GovernanceSummary, Exception]]:
+        """Returns the summaries in the order of the contracts. A failed contract
+        (e.g. an unreachable network) is returned as its exception"""
+
+        heads = {
+            rpc_url: asyncio.ensure_future(self.fetch(rpc_url, 'chains/main/blocks/head/header'))
+            for rpc_url in {contract.rpc_url for contract in self.contracts}
+        }
+        return await asyncio.gather(
+            *(self.refresh_contract(contract, heads[contract.rpc_url]) for contract in self.contracts),
+            return_exceptions=True,
+        )
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False)
+        self.session.close()
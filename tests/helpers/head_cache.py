@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from pytezos.client import PyTezosClient
+from typing import Any, Callable, Hashable, Optional
+
+
+class HeadCache:
+    """LRU cache of contract reads keyed by (contract address, block hash).
+    Entries of the previous blocks are dropped when a new head is set"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.entries: OrderedDict[tuple, Any] = OrderedDict()
+        self.head_hash: Optional[str] = None
+        self.head_level: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def set_head(self, block_hash: str, level: int) -> None:
+        """Moves the cache to a new head block. Can be fed by a head monitor
+        to avoid any request to the node"""
+
+        if block_hash == self.head_hash:
+            return
+        self.head_hash = block_hash
+        self.head_level = level
+        stale_keys = [key for key in self.entries if key[1] != block_hash]
+        for key in stale_keys:
+            del self.entries[key]
+
+    def update_head(self, client: PyTezosClient) -> None:
+        """Requests the head block header and moves the cache to it"""
+
+        header = client.shell.head.header()
+        self.set_head(header['hash'], int(header['level']))
+
+    def refresh_head(self, client: PyTezosClient) -> None:
+        """Compares the head block hash of the node with the cached one
+        and moves the cache to the node head if they differ"""
+
+        if client.shell.head.hash() != self.head_hash:
+            self.update_head(client)
+
+    def get(self, address: str, block_hash: str, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Returns the cached value or fetches and caches it"""
+
+        cache_key = (address, block_hash, key)
+        if cache_key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(cache_key)
+            return self.entries[cache_key]
+
+        self.misses += 1
+        value = fetch()
+        self.entries[cache_key] = value
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,493 @@
+import json
+import sqlite3
+from dataclasses import asdict, dataclass
+from pytezos.client import PyTezosClient
+from pytezos.michelson.types.base import MichelsonType
+from tests.helpers.storage import (
+    GovernanceStorage,
+    SequencerPayload,
+    decode_kernel_governance_storage,
+    decode_kernel_payload,
+    decode_sequencer_governance_storage,
+    decode_sequencer_payload,
+    decode_string,
+)
+from tests.helpers.voting_state import VotingState, compute_voting_state
+from typing import Any, Callable, Optional
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS checkpoints (
+    contract TEXT PRIMARY KEY,
+    level INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS indexed_blocks (
+    contract TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    PRIMARY KEY (contract, level)
+);
+CREATE TABLE IF NOT EXISTS operations (
+    contract TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    op_hash TEXT NOT NULL,
+    sender TEXT NOT NULL,
+    entrypoint TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS operations_by_level ON operations (contract, level);
+CREATE INDEX IF NOT EXISTS operations_by_sender ON operations (contract, sender);
+CREATE TABLE IF NOT EXISTS proposals (
+    contract TEXT NOT NULL,
+    period_index INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    proposer TEXT NOT NULL,
+    voting_power INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    op_hash TEXT NOT NULL,
+    PRIMARY KEY (contract, period_index, payload)
+);
+CREATE TABLE IF NOT EXISTS upvotes (
+    contract TEXT NOT NULL,
+    period_index INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    upvoter TEXT NOT NULL,
+    voting_power INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    op_hash TEXT NOT NULL,
+    PRIMARY KEY (contract, period_index, payload, upvoter)
+);
+CREATE INDEX IF NOT EXISTS upvotes_by_upvoter ON upvotes (contract, upvoter);
+CREATE TABLE IF NOT EXISTS ballots (
+    contract TEXT NOT NULL,
+    period_index INTEGER NOT NULL,
+    voter TEXT NOT NULL,
+    ballot TEXT NOT NULL,
+    voting_power INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    op_hash TEXT NOT NULL,
+    PRIMARY KEY (contract, period_index, voter)
+);
+CREATE TABLE IF NOT EXISTS periods (
+    contract TEXT NOT NULL,
+    period_index INTEGER NOT NULL,
+    period_type TEXT NOT NULL,
+    total_voting_power INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    PRIMARY KEY (contract, period_index)
+);
+CREATE TABLE IF NOT EXISTS finished_votings (
+    contract TEXT NOT NULL,
+    finished_at_period_index INTEGER NOT NULL,
+    finished_at_period_type TEXT NOT NULL,
+    winner_payload TEXT,
+    level INTEGER NOT NULL,
+    PRIMARY KEY (contract, finished_at_period_index)
+);
+CREATE INDEX IF NOT EXISTS finished_votings_by_winner ON finished_votings (contract, winner_payload);
+CREATE TABLE IF NOT EXISTS triggers (
+    contract TEXT NOT NULL,
+    rollup_address TEXT NOT NULL,
+    upgrade_payload TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    op_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS triggers_by_rollup ON triggers (contract, rollup_address);
+'''
+
+
+VOTING_ENTRYPOINTS = {'new_proposal', 'upvote_proposal', 'upvote_proposals', 'vote'}
+
+STORAGE_DECODERS: dict[str, Callable[[Any], GovernanceStorage]] = {
+    'kernel': decode_kernel_governance_storage,
+    'sequencer': decode_sequencer_governance_storage,
+}
+
+PAYLOAD_DECODERS: dict[str, Callable[[Any], Any]] = {
+    'kernel': decode_kernel_payload,
+    'sequencer': decode_sequencer_payload,
+}
+
+
+@dataclass(slots=True)
+class GovernanceCall:
+    """An applied call of the contract, made by a top-level or an internal transaction,
+    with the operations the contract emitted (events and upgrade transactions)"""
+
+    op_hash: str
+    sender: str
+    entrypoint: str
+    value: Any
+    emitted: list[dict]
+
+
+def encode_payload(payload: Any) -> str:
+    """Encodes a kernel root hash or a sequencer payload to a text column value"""
+
+    if isinstance(payload, bytes):
+        return payload.hex()
+    if isinstance(payload, SequencerPayload):
+        payload = asdict(payload)
+    return json.dumps({
+        key: value.hex() if isinstance(value, bytes) else value
+        for key, value in payload.items()
+    }, sort_keys=True)
+
+
+def decode_event_payload(event: dict) -> dict:
+    return MichelsonType.match(event['type']).from_micheline_value(event['payload']).to_python_object()
+
+
+def make_call(op_hash: str, sender: str, transaction: dict) -> GovernanceCall:
+    parameters = transaction.get('parameters', {'entrypoint': 'default', 'value': {'prim': 'Unit'}})
+    return GovernanceCall(op_hash, sender, parameters['entrypoint'], parameters['value'], [])
+
+
+def get_governance_operations(block: dict, contract_address: str) -> list[GovernanceCall]:
+    """Returns the applied calls of the contract from the manager operations of given block,
+    both the top-level transactions and the internal ones sent by other contracts"""
+
+    calls = []
+    for operation in block['operations'][3]:
+        for content in operation['contents']:
+            metadata = content['metadata']
+            if metadata['operation_result']['status'] != 'applied':
+                continue
+            call = None
+            if content['kind'] == 'transaction' and content['destination'] == contract_address:
+                call = make_call(operation['hash'], content['source'], content)
+                calls.append(call)
+            for result in metadata.get('internal_operation_results', []):
+                if result['result']['status'] != 'applied':
+                    continue
+                if result['kind'] == 'transaction' and result['destination'] == contract_address:
+                    call = make_call(operation['hash'], result['source'], result)
+                    calls.append(call)
+                # NOTE: the internal operations are applied depth-first, so the contract
+                # outputs are listed after the call which emitted them
+                elif result['source'] == contract_address and call is not None:
+                    call.emitted.append(result)
+    return calls
+
+
+def has_events(call: GovernanceCall) -> bool:
+    return any(result['kind'] == 'event' for result in call.emitted)
+
+
+def get_replayed_calls(calls: list[GovernanceCall]) -> list[GovernanceCall]:
+    """Returns the calls without events. They are made to the contracts deployed before the events were added
+    or don't change the voting state, and are replayed from their parameters and the storage"""
+
+    return [call for call in calls if not has_events(call)]
+
+
+def fetch_block_context(client: PyTezosClient, block: dict, contract_address: str, with_storage: bool = True) -> Optional[dict]:
+    """Fetches what the contract reads while given block is applied: the storage before the block
+    (unless with_storage is False), the total voting power and the voting powers of the senders.
+    Returns None if every call of the contract in the block emitted events, since the events have all the indexed data"""
+
+    calls = get_replayed_calls(get_governance_operations(block, contract_address))
+    if not calls:
+        return None
+    # NOTE: the voting listings are updated at the end of a block, so the predecessor context has the ones used by the block
+    predecessor = client.shell.blocks[block['header']['predecessor']]
+    voters = {call.sender for call in calls if call.entrypoint in VOTING_ENTRYPOINTS}
+    context = {
+        'total_voting_power': int(predecessor.votes.total_voting_power()),
+        'voting_powers': {voter: int(predecessor.context.delegates[voter].voting_power()) for voter in voters},
+    }
+    if with_storage:
+        context['storage'] = predecessor.context.contracts[contract_address].storage()
+    return context
+
+
+@dataclass(slots=True)
+class PeriodState:
+    period_index: int
+    period_type: str
+    # NOTE: unknown for the periods without any call, only their finished voting is found later
+    total_voting_power: Optional[int]
+    upvotes: dict[str, int]
+    ballots: dict[str, int]
+    finished_voting: Optional[tuple[str, Optional[str]]]
+
+
+class GovernanceIndexer:
+    """Applies the governance calls of the blocks to the SQLite tables.
+    Proposals, upvotes, ballots, started periods and finished votings are decoded from the events
+    the contract emitted, which are in the operation receipts. The calls without events are replayed as a fallback:
+    the payloads and ballots are decoded from the entrypoint parameters, the period and the finished voting
+    are computed from the storage before the block the way the contract does, and the voting powers are read
+    from the node. Upgrade triggers are taken from the transactions to the rollups"""
+
+    def __init__(self, connection: sqlite3.Connection, contract_address: str, kind: str = 'kernel'):
+        self.connection = connection
+        self.contract_address = contract_address
+        self.decode_storage = STORAGE_DECODERS[kind]
+        self.decode_payload = PAYLOAD_DECODERS[kind]
+        self.connection.executescript(SCHEMA)
+        self.call_handlers: dict[str, Callable[[GovernanceCall, int, int, dict], None]] = {
+            'new_proposal': self.apply_new_proposal,
+            'upvote_proposal': self.apply_upvote_proposal,
+            'upvote_proposals': self.apply_upvote_proposals,
+            'vote': self.apply_vote,
+        }
+        self.event_handlers: dict[str, Callable[[dict, int, str], None]] = {
+            'voting_finished': self.apply_voting_finished_event,
+            'period_started': self.apply_period_started_event,
+            'new_proposal': self.apply_new_proposal_event,
+            'upvote_proposal': self.apply_upvote_proposal_event,
+            'vote': self.apply_vote_event,
+        }
+
+    def get_last_indexed_level(self) -> Optional[int]:
+        """Returns the checkpoint level, all the blocks up to it are indexed"""
+
+        row = self.connection.execute(
+            'SELECT level FROM checkpoints WHERE contract = ?',
+            (self.contract_address,),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def set_checkpoint(self, level: int) -> None:
+        self.connection.execute(
+            'INSERT OR REPLACE INTO checkpoints VALUES (?, ?)',
+            (self.contract_address, level),
+        )
+
+    def fetch_block(self, client: PyTezosClient, level: int) -> dict:
+        """Fetches the block of given level with the context of the replayed governance calls"""
+
+        block = client.shell.blocks[level]()
+        block['governance_context'] = fetch_block_context(client, block, self.contract_address)
+        return block
+
+    def apply_block(self, block: dict, storage: Optional[GovernanceStorage] = None) -> int:
+        """Applies the calls of given block fetched with its context without committing
+        and returns the number of governance calls found. The storage before the block
+        is decoded from the block context unless it is given"""
+
+        level = int(block['header']['level'])
+        calls = get_governance_operations(block, self.contract_address)
+        period_index, voting_powers = None, {}
+        if get_replayed_calls(calls):
+            context = block['governance_context']
+            storage = storage if storage is not None else self.decode_storage(context['storage'])
+            voting_state = compute_voting_state(storage, level)
+            self.apply_voting_state(voting_state, storage, context['total_voting_power'], level)
+            period_index, voting_powers = voting_state.period_index, context['voting_powers']
+        for call in calls:
+            self.apply_operation(call, level, period_index, voting_powers)
+        self.connection.execute(
+            'INSERT OR REPLACE INTO indexed_blocks VALUES (?, ?, ?, ?)',
+            (self.contract_address, level, block['hash'], block['header']['timestamp']),
+        )
+        return len(calls)
+
+    def index_block(self, block: dict) -> int:
+        """Applies the calls of given block and moves the checkpoint to it in one transaction"""
+
+        with self.connection:
+            operations_count = self.apply_block(block)
+            self.set_checkpoint(int(block['header']['level']))
+        return operations_count
+
+    def index_level(self, client: PyTezosClient, level: int) -> int:
+        return self.index_block(self.fetch_block(client, level))
+
+    def follow(self, client: PyTezosClient, start_level: int, confirmations: int = 2) -> None:
+        """Indexes the blocks from start level (or the last indexed one) up to the head
+        minus given confirmations, so only the blocks which cannot be reorganized are applied"""
+
+        last_indexed_level = self.get_last_indexed_level()
+        level = start_level if last_indexed_level is None else last_indexed_level + 1
+        head_level = int(client.shell.head.header()['level'])
+        while level <= head_level - confirmations:
+            self.index_level(client, level)
+            level += 1
+
+    def apply_voting_state(self, voting_state: VotingState, storage: GovernanceStorage, total_voting_power: int, level: int) -> None:
+        """Records the period of the block and the voting finished by its first call"""
+
+        voting_context = storage.voting_context
+        if voting_context is not None and voting_context.period_index == voting_state.period_index:
+            # NOTE: the period is started by an earlier block, its total voting power is kept in the storage
+            total_voting_power = voting_context.period.total_voting_power
+        self.insert_period(voting_state.period_index, voting_state.period_type, total_voting_power, level)
+        finished_voting = voting_state.finished_voting
+        if finished_voting is not None:
+            self.insert_finished_voting(
+                finished_voting.finished_at_period_index,
+                finished_voting.finished_at_period_type,
+                finished_voting.winner_proposal_payload,
+                level,
+            )
+
+    def insert_period(self, period_index: int, period_type: str, total_voting_power: int, level: int) -> None:
+        self.connection.execute(
+            'INSERT OR IGNORE INTO periods VALUES (?, ?, ?, ?, ?)',
+            (self.contract_address, period_index, period_type, total_voting_power, level),
+        )
+
+    def insert_finished_voting(self, finished_at_period_index: int, finished_at_period_type: str, winner: Any, level: int) -> None:
+        self.connection.execute(
+            'INSERT OR REPLACE INTO finished_votings VALUES (?, ?, ?, ?, ?)',
+            (
+                self.contract_address, finished_at_period_index, finished_at_period_type,
+                encode_payload(winner) if winner is not None else None, level,
+            ),
+        )
+
+    def insert_proposal(self, period_index: int, payload: str, proposer: str, voting_power: int, level: int, op_hash: str) -> None:
+        self.connection.execute(
+            'INSERT INTO proposals VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (self.contract_address, period_index, payload, proposer, voting_power, level, op_hash),
+        )
+        # NOTE: the proposer upvotes the new proposal
+        self.insert_upvote(period_index, payload, proposer, voting_power, level, op_hash)
+
+    def insert_upvote(self, period_index: int, payload: str, upvoter: str, voting_power: int, level: int, op_hash: str) -> None:
+        self.connection.execute(
+            'INSERT INTO upvotes VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (self.contract_address, period_index, payload, upvoter, voting_power, level, op_hash),
+        )
+
+    def insert_ballot(self, period_index: int, voter: str, ballot: str, voting_power: int, level: int, op_hash: str) -> None:
+        self.connection.execute(
+            'INSERT INTO ballots VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (self.contract_address, period_index, voter, ballot, voting_power, level, op_hash),
+        )
+
+    def apply_operation(self, call: GovernanceCall, level: int, period_index: Optional[int], voting_powers: dict[str, int]) -> None:
+        """Applies the call from its events, or replays it from its parameters if it has none"""
+
+        self.connection.execute(
+            'INSERT INTO operations VALUES (?, ?, ?, ?, ?)',
+            (self.contract_address, level, call.op_hash, call.sender, call.entrypoint),
+        )
+        if not has_events(call):
+            handler = self.call_handlers.get(call.entrypoint)
+            if handler is not None:
+                handler(call, level, period_index, voting_powers)
+        for result in call.emitted:
+            if result['kind'] == 'transaction':
+                self.apply_trigger(result, level, call.op_hash)
+            elif result['kind'] == 'event':
+                handler = self.event_handlers.get(result['tag'])
+                if handler is not None:
+                    handler(decode_event_payload(result), level, call.op_hash)
+
+    def apply_voting_finished_event(self, event: dict, level: int, op_hash: str) -> None:
+        self.insert_finished_voting(
+            event['finished_at_period_index'],
+            event['finished_at_period_type'],
+            event['winner_proposal_payload'],
+            level,
+        )
+
+    def apply_period_started_event(self, event: dict, level: int, op_hash: str) -> None:
+        self.insert_period(event['period_index'], event['period_type'], event['total_voting_power'], level)
+
+    def apply_new_proposal_event(self, event: dict, level: int, op_hash: str) -> None:
+        payload = encode_payload(event['payload'])
+        self.insert_proposal(event['period_index'], payload, event['proposer'], event['voting_power'], level, op_hash)
+
+    def apply_upvote_proposal_event(self, event: dict, level: int, op_hash: str) -> None:
+        payload = encode_payload(event['payload'])
+        self.insert_upvote(event['period_index'], payload, event['upvoter'], event['voting_power'], level, op_hash)
+
+    def apply_vote_event(self, event: dict, level: int, op_hash: str) -> None:
+        self.insert_ballot(event['period_index'], event['voter'], event['ballot'], event['voting_power'], level, op_hash)
+
+    def apply_new_proposal(self, call: GovernanceCall, level: int, period_index: int, voting_powers: dict[str, int]) -> None:
+        payload = encode_payload(self.decode_payload(call.value))
+        self.insert_proposal(period_index, payload, call.sender, voting_powers[call.sender], level, call.op_hash)
+
+    def apply_upvote_proposal(self, call: GovernanceCall, level: int, period_index: int, voting_powers: dict[str, int]) -> None:
+        payload = encode_payload(self.decode_payload(call.value))
+        self.insert_upvote(period_index, payload, call.sender, voting_powers[call.sender], level, call.op_hash)
+
+    def apply_upvote_proposals(self, call: GovernanceCall, level: int, period_index: int, voting_powers: dict[str, int]) -> None:
+        for value in call.value:
+            payload = encode_payload(self.decode_payload(value))
+            self.insert_upvote(period_index, payload, call.sender, voting_powers[call.sender], level, call.op_hash)
+
+    def apply_vote(self, call: GovernanceCall, level: int, period_index: int, voting_powers: dict[str, int]) -> None:
+        self.insert_ballot(period_index, call.sender, decode_string(call.value), voting_powers[call.sender], level, call.op_hash)
+
+    def apply_trigger(self, transaction: dict, level: int, op_hash: str) -> None:
+        # NOTE: the rollup parameter is an `or` with the upgrade payload bytes inside
+        value = transaction['parameters']['value']
+        while 'bytes' not in value:
+            value = value['args'][0]
+        upgrade_payload = value['bytes']
+        self.connection.execute(
+            'INSERT INTO triggers VALUES (?, ?, ?, ?, ?)',
+            (self.contract_address, transaction['destination'], upgrade_payload, level, op_hash),
+        )
+
+    def get_proposals(self, period_index: int) -> list[tuple]:
+        """Returns the proposals of given period with the upvotes voting power, the leader first"""
+
+        return self.connection.execute(
+            '''
+            SELECT proposals.payload, proposals.proposer, SUM(upvotes.voting_power) AS upvotes_voting_power
+            FROM proposals
+            JOIN upvotes USING (contract, period_index, payload)
+            WHERE proposals.contract = ? AND proposals.period_index = ?
+            GROUP BY proposals.payload
+            ORDER BY upvotes_voting_power DESC
+            ''',
+            (self.contract_address, period_index),
+        ).fetchall()
+
+    def get_ballots_summary(self, period_index: int) -> dict[str, int]:
+        rows = self.connection.execute(
+            'SELECT ballot, SUM(voting_power) FROM ballots WHERE contract = ? AND period_index = ? GROUP BY ballot',
+            (self.contract_address, period_index),
+        ).fetchall()
+        return dict(rows)
+
+    def get_period_states(self) -> list[PeriodState]:
+        """Reconstructs the state of every started period from the replayed history"""
+
+        states = {
+            period_index: PeriodState(period_index, period_type, total_voting_power, {}, {}, None)
+            for period_index, period_type, total_voting_power in self.connection.execute(
+                'SELECT period_index, period_type, total_voting_power FROM periods WHERE contract = ? ORDER BY period_index',
+                (self.contract_address,),
+            )
+        }
+        upvotes = self.connection.execute(
+            'SELECT period_index, payload, SUM(voting_power) FROM upvotes WHERE contract = ? GROUP BY period_index, payload',
+            (self.contract_address,),
+        )
+        for period_index, payload, voting_power in upvotes:
+            states[period_index].upvotes[payload] = voting_power
+        ballots = self.connection.execute(
+            'SELECT period_index, ballot, SUM(voting_power) FROM ballots WHERE contract = ? GROUP BY period_index, ballot',
+            (self.contract_address,),
+        )
+        for period_index, ballot, voting_power in ballots:
+            states[period_index].ballots[ballot] = voting_power
+        finished_votings = self.connection.execute(
+            'SELECT finished_at_period_index, finished_at_period_type, winner_payload FROM finished_votings WHERE contract = ?',
+            (self.contract_address,),
+        )
+        for finished_at_period_index, finished_at_period_type, winner_payload in finished_votings:
+            # NOTE: the voting is finished at the start of the next period
+            finished_period_index = finished_at_period_index - 1
+            if finished_period_index not in states:
+                states[finished_period_index] = PeriodState(finished_period_index, finished_at_period_type, None, {}, {}, None)
+            states[finished_period_index].finished_voting = (finished_at_period_type, winner_payload)
+        return sorted(states.values(), key=lambda state: state.period_index)
+
+    def get_winners(self) -> list[tuple]:
+        return self.connection.execute(
+            '''
+            SELECT finished_at_period_index, winner_payload, level FROM finished_votings
+            WHERE contract = ? AND winner_payload IS NOT NULL
+            ORDER BY finished_at_period_index
+            ''',
+            (self.contract_address,),
+        ).fetchall()
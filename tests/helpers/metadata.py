@@ -1,5 +1,6 @@
 import json
-from typing import Any
+from typing import Any, Optional
+from pytezos.michelson.parse import michelson_to_micheline
 
 
 def to_hex(string: str) -> str:
@@ -35,3 +36,31 @@ class Metadata:
         metadata = cls.template.copy()
         metadata.update(kwargs)
         return Metadata.make(**metadata)
+
+    @staticmethod
+    def make_offchain_views(contract_filename: str, view_names: Optional[list[str]] = None) -> list[dict]:
+        """Creates TZIP-16 off-chain views from the on-chain views of the compiled contract.
+        Both take a pair of the parameter and the storage, so the view code is reused as is"""
+
+        with open(contract_filename) as f:
+            script = michelson_to_micheline(f.read())
+
+        views = []
+        for section in script:
+            if section['prim'] != 'view':
+                continue
+            name, parameter, return_type, code = section['args']
+            if view_names is not None and name['string'] not in view_names:
+                continue
+            views.append({
+                'name': name['string'],
+                'implementations': [{
+                    'michelsonStorageView': {
+                        'parameter': parameter,
+                        'returnType': return_type,
+                        'code': code,
+                    }
+                }],
+            })
+        # NOTE: converts pytezos micheline sequences to plain json values
+        return json.loads(json.dumps(views))
\ No newline at end of file
@@ -1,5 +1,7 @@
 import json
+import math
 from pytezos.operation.result import OperationResult
+from tests.helpers.utility import get_events_from_op
 
 class OperationResultRecorder:
     def __init__(self):
@@ -10,6 +12,11 @@ class OperationResultRecorder:
             'consumed_gas': OperationResult.consumed_gas(op),
             'paid_storage_size_diff': OperationResult.paid_storage_size_diff(op),
         }
+        events = get_events_from_op(op)
+        if events:
+            # NOTE: the gas of the emitted events is included in consumed_gas
+            value['events_count'] = len(events)
+            value['events_consumed_gas'] = sum(math.ceil(int(event['result'].get('consumed_milligas', '0')) / 1000) for event in events)
         self.data[key] = value
 
     def write_to_file(self, filename):
@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+
+
+P = TypeVar('P')
+
+
+@dataclass(slots=True)
+class SequencerPayload:
+    sequencer_pk: str
+    pool_address: bytes
+
+
+@dataclass(slots=True)
+class Config:
+    started_at_level: int
+    period_length: int
+    adoption_period_sec: int
+    upvoting_limit: int
+    scale: int
+    proposal_quorum: int
+    promotion_quorum: int
+    promotion_supermajority: int
+
+
+@dataclass(slots=True)
+class ProposalPeriod(Generic[P]):
+    max_upvotes_voting_power: Optional[int]
+    winner_candidate: Optional[P]
+    total_voting_power: int
+
+
+@dataclass(slots=True)
+class PromotionPeriod(Generic[P]):
+    yea_voting_power: int
+    nay_voting_power: int
+    pass_voting_power: int
+    total_voting_power: int
+    winner_candidate: P
+
+
+@dataclass(slots=True)
+class VotingContext(Generic[P]):
+    period_index: int
+    period: Union[ProposalPeriod[P], PromotionPeriod[P]]
+
+
+@dataclass(slots=True)
+class VotingWinner(Generic[P]):
+    payload: P
+    trigger_history: int
+    payload_prefix: Optional[bytes]
+
+
+@dataclass(slots=True)
+class GovernanceStorage(Generic[P]):
+    """Typed governance contract storage. Big maps are kept as their ids"""
+
+    config: Config
+    voting_context: Optional[VotingContext[P]]
+    last_winner: Optional[VotingWinner[P]]
+    proposals: int
+    upvoters_proposals: int
+    payloads: int
+    voters: int
+    # None for the tracks of the multi-track contract, only the contract itself has the metadata
+    metadata: Optional[int]
+
+
+@dataclass(slots=True)
+class MultiTrackGovernanceStorage:
+    tracks: dict[str, GovernanceStorage[bytes]]
+    metadata: int
+
+
+PayloadDecoder = Callable[[Any], P]
+
+
+def unpair(node: Any, size: int) -> list:
+    """Flattens a right comb of given size. Accepts nested pairs,
+    flat `Pair` nodes and the sequence notation of combs"""
+
+    items = []
+    while len(items) < size - 1:
+        args = node if isinstance(node, list) else node['args']
+        items.extend(args[:-1])
+        node = args[-1]
+    items.append(node)
+    return items
+
+
+def decode_nat(node: dict) -> int:
+    return int(node['int'])
+
+
+def decode_bytes(node: dict) -> bytes:
+    return bytes.fromhex(node['bytes'])
+
+
+def decode_string(node: dict) -> str:
+    return node['string']
+
+
+def decode_unit(node: dict) -> None:
+    return None
+
+
+def decode_option(node: dict, decode_value: Callable[[Any], Any]) -> Any:
+    if node['prim'] == 'None':
+        return None
+    return decode_value(node['args'][0])
+
+
+def decode_kernel_payload(node: dict) -> bytes:
+    return decode_bytes(node)
+
+
+def decode_sequencer_payload(node: Any) -> SequencerPayload:
+    sequencer_pk, pool_address = unpair(node, 2)
+    return SequencerPayload(decode_string(sequencer_pk), decode_bytes(pool_address))
+
+
+def decode_config(node: Any) -> Config:
+    return Config(*map(decode_nat, unpair(node, 8)))
+
+
+def decode_voting_context(node: Any, decode_payload: PayloadDecoder) -> VotingContext:
+    period_index, period = unpair(node, 2)
+    if period['prim'] == 'Left':
+        max_upvotes_voting_power, winner_candidate, total_voting_power = unpair(period['args'][0], 3)
+        decoded_period = ProposalPeriod(
+            decode_option(max_upvotes_voting_power, decode_nat),
+            decode_option(winner_candidate, decode_payload),
+            decode_nat(total_voting_power),
+        )
+    else:
+        yea, nay, pass_, total_voting_power, winner_candidate = unpair(period['args'][0], 5)
+        decoded_period = PromotionPeriod(
+            decode_nat(yea),
+            decode_nat(nay),
+            decode_nat(pass_),
+            decode_nat(total_voting_power),
+            decode_payload(winner_candidate),
+        )
+    return VotingContext(decode_nat(period_index), decoded_period)
+
+
+def decode_voting_winner(node: Any, decode_payload: PayloadDecoder) -> VotingWinner:
+    payload, trigger_history, payload_prefix = unpair(node, 3)
+    return VotingWinner(
+        decode_payload(payload),
+        decode_nat(trigger_history),
+        decode_option(payload_prefix, decode_bytes),
+    )
+
+
+def decode_storage(
+    node: Any,
+    decode_payload: PayloadDecoder,
+    decode_metadata: Callable[[Any], Optional[int]] = decode_nat,
+) -> GovernanceStorage:
+    """Decodes the Micheline storage of a governance contract
+    using given payload decoder"""
+
+    (
+        config,
+        voting_context,
+        last_winner,
+        proposals,
+        upvoters_proposals,
+        payloads,
+        voters,
+        metadata,
+    ) = unpair(node, 8)
+    return GovernanceStorage(
+        decode_config(config),
+        decode_option(voting_context, lambda value: decode_voting_context(value, decode_payload)),
+        decode_option(last_winner, lambda value: decode_voting_winner(value, decode_payload)),
+        decode_nat(proposals),
+        decode_nat(upvoters_proposals),
+        decode_nat(payloads),
+        decode_nat(voters),
+        decode_metadata(metadata),
+    )
+
+
+def decode_kernel_governance_storage(node: Any) -> GovernanceStorage[bytes]:
+    """Decodes the Micheline storage of the kernel governance contract"""
+
+    return decode_storage(node, decode_kernel_payload)
+
+
+def decode_sequencer_governance_storage(node: Any) -> GovernanceStorage[SequencerPayload]:
+    """Decodes the Micheline storage of the sequencer governance contract"""
+
+    return decode_storage(node, decode_sequencer_payload)
+
+
+def decode_multi_track_kernel_governance_storage(node: Any) -> MultiTrackGovernanceStorage:
+    """Decodes the Micheline storage of the multi-track kernel governance contract"""
+
+    tracks, metadata = unpair(node, 2)
+    return MultiTrackGovernanceStorage(
+        {
+            decode_string(element['args'][0]): decode_storage(element['args'][1], decode_kernel_payload, decode_unit)
+            for element in tracks
+        },
+        decode_nat(metadata),
+    )
@@ -1,7 +1,10 @@
 from pytezos.client import PyTezosClient
 from pytezos.contract.interface import ContractInterface
 from pytezos.operation.group import OperationGroup
+from glob import glob
+from hashlib import sha256
 from os.path import dirname
+from os.path import exists
 from os.path import join
 from pytezos.michelson.parse import michelson_to_micheline
 from pytezos.michelson.types.base import MichelsonType
@@ -51,6 +54,17 @@ def find_op_by_hash(client: PyTezosClient, opg: OperationGroup) -> dict:
     return op  # type: ignore
 
 
+def get_events_from_op(op: dict) -> list[dict]:
+    """Returns the events emitted by given operation dict"""
+
+    events = []
+    for content in op['contents']:
+        for result in content['metadata'].get('internal_operation_results', []):
+            if result['kind'] == 'event':
+                events.append(result)
+    return events
+
+
 def get_address_from_op(op: dict) -> str:
     """Returns originated contract address from given operation dict"""
 
@@ -69,6 +83,29 @@ def get_build_dir() -> str:
 
     return join(dirname(__file__), '..', '..', 'build')
 
+
+def get_sources_hash() -> str:
+    """Returns the hash of the contract sources computed the same way
+    as the one `make compile` writes to build/sources.sha256"""
+
+    root_dir = join(dirname(__file__), '..', '..')
+    lines = []
+    for path in sorted(glob('contracts/**/*.mligo', root_dir=root_dir, recursive=True)):
+        with open(join(root_dir, path), 'rb') as file:
+            lines.append(f'{sha256(file.read()).hexdigest()}  {path}\n')
+    return sha256(''.join(lines).encode()).hexdigest()
+
+
+def assert_build_is_fresh() -> None:
+    """Fails if the build is missing or was compiled from other contract sources"""
+
+    filename = join(get_build_dir(), 'sources.sha256')
+    if not exists(filename):
+        raise Exception('The build is missing, run `make compile`')
+    with open(filename) as file:
+        if file.read().strip() != get_sources_hash():
+            raise Exception('The build is older than the contract sources, run `make compile`')
+
 def get_tests_dir() -> str:
     """Returns path to the test directory"""
 
@@ -120,6 +157,7 @@ def originate_from_file(
     """Deploys contract from filename with given storage
     using given client and returns OperationGroup"""
 
+    assert_build_is_fresh()
     print(f'deploying contract from filename {filename}')
     raw_contract = ContractInterface.from_file(filename)
     contract = raw_contract.using(key=client.key, shell=client.shell)
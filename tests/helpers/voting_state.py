@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from tests.helpers.errors import CURRENT_LEVEL_LESS_THAN_START_LEVEL
+from tests.helpers.storage import (
+    Config,
+    GovernanceStorage,
+    PromotionPeriod,
+    ProposalPeriod,
+)
+from typing import Any, Generic, Optional, TypeVar
+
+
+P = TypeVar('P')
+
+PROPOSAL_PERIOD = 'proposal'
+PROMOTION_PERIOD = 'promotion'
+
+
+@dataclass(slots=True)
+class VotingFinished(Generic[P]):
+    finished_at_period_index: int
+    finished_at_period_type: str
+    winner_proposal_payload: Optional[P]
+
+
+@dataclass(slots=True)
+class VotingState(Generic[P]):
+    """The same fields as the get_voting_state view returns"""
+
+    period_index: int
+    period_type: str
+    remaining_blocks: int
+    finished_voting: Optional[VotingFinished[P]]
+
+
+def get_proposal_winner(proposal_period: ProposalPeriod, config: Config) -> Optional[Any]:
+    winner_upvotes_power = proposal_period.max_upvotes_voting_power or 0
+    proposal_quorum_reached = winner_upvotes_power * config.scale >= proposal_period.total_voting_power * config.proposal_quorum
+    return proposal_period.winner_candidate if proposal_quorum_reached else None
+
+
+def get_promotion_winner(promotion_period: PromotionPeriod, config: Config) -> Optional[Any]:
+    yea_voting_power = promotion_period.yea_voting_power
+    yea_nay_voting_sum = yea_voting_power + promotion_period.nay_voting_power
+    voted_voting_power = yea_nay_voting_sum + promotion_period.pass_voting_power
+    quorum_reached = voted_voting_power * config.scale >= config.promotion_quorum * promotion_period.total_voting_power
+    supermajority_reached = yea_nay_voting_sum > 0 and yea_voting_power * config.scale >= config.promotion_supermajority * yea_nay_voting_sum
+    return promotion_period.winner_candidate if quorum_reached and supermajority_reached else None
+
+
+def compute_voting_state(storage: GovernanceStorage[P], level: int) -> VotingState[P]:
+    """Computes the voting state at given level the way the get_voting_state view does,
+    so it can be read from the storage without running the view on the node"""
+
+    config = storage.config
+    blocks_after_start = level - config.started_at_level
+    if blocks_after_start < 0:
+        raise ValueError(CURRENT_LEVEL_LESS_THAN_START_LEVEL)
+    period_index, remainder = divmod(blocks_after_start, config.period_length)
+    remaining_blocks = config.period_length - remainder
+
+    voting_context = storage.voting_context
+    period_type = PROPOSAL_PERIOD
+    finished_voting = None
+    if voting_context is not None:
+        period = voting_context.period
+        if period_index == voting_context.period_index:
+            period_type = PROPOSAL_PERIOD if isinstance(period, ProposalPeriod) else PROMOTION_PERIOD
+        elif isinstance(period, ProposalPeriod):
+            if get_proposal_winner(period, config) is not None:
+                promotion_period_index = voting_context.period_index + 1
+                if period_index == promotion_period_index:
+                    period_type = PROMOTION_PERIOD
+                else:
+                    finished_voting = VotingFinished(promotion_period_index + 1, PROMOTION_PERIOD, None)
+            elif period.max_upvotes_voting_power is not None:
+                finished_voting = VotingFinished(voting_context.period_index + 1, PROPOSAL_PERIOD, None)
+        else:
+            promotion_winner = get_promotion_winner(period, config)
+            finished_voting = VotingFinished(voting_context.period_index + 1, PROMOTION_PERIOD, promotion_winner)
+
+    return VotingState(period_index, period_type, remaining_blocks, finished_voting)
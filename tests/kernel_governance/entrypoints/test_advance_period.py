@@ -0,0 +1,106 @@
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import PROMOTION_PERIOD, PROPOSAL_PERIOD, YEA_VOTE
+from tests.helpers.errors import TEZ_IN_TRANSACTION_DISALLOWED
+from tests.helpers.utility import DEFAULT_TOTAL_VOTING_POWER, DEFAULT_VOTING_POWER
+
+class KernelGovernanceAdvancePeriodTestCase(BaseTestCase):
+    def test_should_fail_if_tez_in_transaction(self) -> None:
+        no_baker = self.bootstrap_no_baker()
+        governance = self.deploy_kernel_governance()
+
+        with self.raisesMichelsonError(TEZ_IN_TRANSACTION_DISALLOWED):
+            governance.using(no_baker).advance_period().with_amount(1).send()
+
+    def test_should_init_voting_context_on_first_call(self) -> None:
+        no_baker = self.bootstrap_no_baker()
+        governance = self.deploy_kernel_governance()
+
+        assert governance.contract.storage()['voting_context'] == None
+
+        governance.using(no_baker).advance_period().send()
+        self.bake_block()
+
+        storage = governance.contract.storage()
+        assert storage['voting_context']['period']['proposal'] == {
+            'max_upvotes_voting_power': None,
+            'winner_candidate': None,
+            'total_voting_power': DEFAULT_TOTAL_VOTING_POWER,
+        }
+
+    def test_should_move_to_promotion_period_and_then_set_last_winner(self) -> None:
+        baker = self.bootstrap_baker()
+        no_baker = self.bootstrap_no_baker()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 3
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 3,
+            'proposal_quorum': 20, # 1 baker out of 5 will vote
+            'promotion_quorum': 20, # 1 baker out of 5 will vote
+            'promotion_supermajority': 50, # 1 baker will vote yea
+        })
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        # Period index: 0. Block: 2 of 3
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_blocks(2)
+
+        # Period index: 1. Block: 1 of 3
+        governance.using(no_baker).advance_period().send()
+        self.bake_block()
+
+        storage = governance.contract.storage()
+        assert storage['voting_context']['period_index'] == 1
+        assert storage['voting_context']['period']['promotion'] == {
+            'winner_candidate': kernel_root_hash,
+            'yea_voting_power': 0,
+            'nay_voting_power': 0,
+            'pass_voting_power': 0,
+            'total_voting_power': DEFAULT_TOTAL_VOTING_POWER,
+        }
+        assert governance.get_voting_state()['period_type'] == PROMOTION_PERIOD
+
+        # Period index: 1. Block: 2 of 3
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_blocks(2)
+
+        # Period index: 2. Block: 1 of 3
+        assert governance.contract.storage()['last_winner'] == None
+        governance.using(no_baker).advance_period().send()
+        self.bake_block()
+
+        storage = governance.contract.storage()
+        assert storage['voting_context']['period_index'] == 2
+        assert storage['last_winner']['payload'] == kernel_root_hash
+        assert governance.get_voting_state() == {
+            'period_type': PROPOSAL_PERIOD,
+            'period_index': 2,
+            'remaining_blocks': 2,
+            'finished_voting': {
+                'finished_at_period_index': 2, 
+                'finished_at_period_type': PROMOTION_PERIOD,
+                'winner_proposal_payload': kernel_root_hash
+            }
+        }
+
+    def test_should_not_change_storage_within_the_same_period(self) -> None:
+        baker = self.bootstrap_baker()
+        no_baker = self.bootstrap_no_baker()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 10,
+        })
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        governance.using(baker).new_proposal(kernel_root_hash).send()
+        self.bake_block()
+        storage_before = governance.contract.storage()
+
+        governance.using(no_baker).advance_period().send()
+        self.bake_block()
+
+        storage_after = governance.contract.storage()
+        assert storage_after['voting_context'] == storage_before['voting_context']
+        assert storage_after['voting_context']['period']['proposal']['max_upvotes_voting_power'] == DEFAULT_VOTING_POWER
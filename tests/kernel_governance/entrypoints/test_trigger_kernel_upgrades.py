@@ -0,0 +1,133 @@
+from pytezos.client import PyTezosClient
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import YEA_VOTE
+from tests.helpers.contracts.kernel_governance import KernelGovernance
+from tests.helpers.errors import (
+    LAST_WINNER_NOT_FOUND,
+    NO_ROLLUPS_TO_UPGRADE,
+    UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED,
+    TEZ_IN_TRANSACTION_DISALLOWED
+)
+from pytezos.michelson.forge import forge_address
+from tests.helpers.utility import DEFAULT_ADDRESS, find_op_by_hash
+import re
+
+class KernelGovernanceTriggerKernelUpgradesTestCase(BaseTestCase):
+    def prepare_last_winner(self, payload):
+        baker = self.bootstrap_baker()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_kernel_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        # Period index: 0. Block: 2 of 2
+        governance.using(baker).new_proposal(payload).send()
+        self.bake_blocks(2)
+
+        # Period index: 1. Block: 2 of 2
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_blocks(2)
+
+        return {
+            'governance': governance,
+            'baker': baker,
+        }
+
+    def test_should_fail_if_tez_in_transaction(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_kernel_governance()
+
+        with self.raisesMichelsonError(TEZ_IN_TRANSACTION_DISALLOWED):
+            governance.using(baker).trigger_kernel_upgrades([DEFAULT_ADDRESS]).with_amount(1).send()
+
+    def test_should_fail_if_there_is_no_last_winner_payload(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_kernel_governance()
+
+        with self.raisesMichelsonError(LAST_WINNER_NOT_FOUND):
+            governance.using(baker).trigger_kernel_upgrades([DEFAULT_ADDRESS]).send()
+
+    def test_should_fail_for_whole_set_if_one_address_was_already_triggered(self) -> None:
+        rollup_mock1 = self.deploy_rollup_mock()
+        rollup_mock2 = self.deploy_rollup_mock()
+        kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        test = self.prepare_last_winner(kernel_root_hash)
+        governance : KernelGovernance = test['governance']
+        baker : PyTezosClient = test['baker']
+
+        governance.using(baker).trigger_kernel_upgrade(rollup_mock1.contract.address).send()
+        self.bake_block()
+
+        with self.raisesMichelsonError(UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED):
+            governance.using(baker).trigger_kernel_upgrades([rollup_mock1.contract.address, rollup_mock2.contract.address]).send()
+
+        # rollup_mock2 was not recorded by the failed call
+        governance.using(baker).trigger_kernel_upgrades([rollup_mock2.contract.address]).send()
+        self.bake_block()
+
+        with self.raisesMichelsonError(UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED):
+            governance.using(baker).trigger_kernel_upgrade(rollup_mock2.contract.address).send()
+
+    def test_should_fail_if_rollup_addresses_set_is_empty(self) -> None:
+        kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        test = self.prepare_last_winner(kernel_root_hash)
+        governance : KernelGovernance = test['governance']
+        baker : PyTezosClient = test['baker']
+
+        with self.raisesMichelsonError(NO_ROLLUPS_TO_UPGRADE):
+            governance.using(baker).trigger_kernel_upgrades([]).send()
+
+    def test_should_send_last_winner_payload_to_all_rollups(self) -> None:
+        rollup_mocks = [self.deploy_rollup_mock() for _ in range(3)]
+        kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        test = self.prepare_last_winner(kernel_root_hash)
+        governance : KernelGovernance = test['governance']
+        baker : PyTezosClient = test['baker']
+
+        payload_pattern = rf'^EBA1{kernel_root_hash.hex()}88[\da-f]{{16}}$'
+        for rollup_mock in rollup_mocks:
+            assert not re.match(payload_pattern, rollup_mock.contract.storage().hex(), re.IGNORECASE)
+
+        rollup_addresses = [rollup_mock.contract.address for rollup_mock in rollup_mocks]
+        opg = governance.using(baker).trigger_kernel_upgrades(rollup_addresses).send()
+        self.bake_block()
+
+        # the upgrades are sent in descending address order
+        op = find_op_by_hash(self.manager, opg)
+        destinations = [
+            result['destination'] for result in op['contents'][0]['metadata']['internal_operation_results']
+            if result['kind'] == 'transaction'
+        ]
+        assert destinations == sorted(rollup_addresses, key=forge_address, reverse=True)
+
+        payloads = [rollup_mock.contract.storage().hex() for rollup_mock in rollup_mocks]
+        for payload in payloads:
+            assert re.match(payload_pattern, payload, re.IGNORECASE)
+        # the payload is built once, so every rollup gets the same activation timestamp
+        assert len(set(payloads)) == 1
+
+        for rollup_mock in rollup_mocks:
+            with self.raisesMichelsonError(UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED):
+                governance.using(baker).trigger_kernel_upgrade(rollup_mock.contract.address).send()
+
+    def test_should_cache_upgrade_payload_prefix(self) -> None:
+        rollup_mock1 = self.deploy_rollup_mock()
+        rollup_mock2 = self.deploy_rollup_mock()
+        kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        test = self.prepare_last_winner(kernel_root_hash)
+        governance : KernelGovernance = test['governance']
+        baker : PyTezosClient = test['baker']
+
+        governance.using(baker).trigger_kernel_upgrades([rollup_mock1.contract.address]).send()
+        self.bake_block()
+        payload_prefix = bytes.fromhex('eba1') + kernel_root_hash + bytes.fromhex('88')
+        assert governance.contract.storage()['last_winner']['payload_prefix'] == payload_prefix
+
+        # the cached prefix is used by the next trigger
+        governance.using(baker).trigger_kernel_upgrade(rollup_mock2.contract.address).send()
+        self.bake_block()
+        assert rollup_mock2.contract.storage()[:-8] == payload_prefix
@@ -27,6 +27,9 @@ class KernelGovernanceNewProposalTestCase(BaseTestCase):
 
         with self.raisesMichelsonError(NOT_PROMOTION_PERIOD):
             governance.using(baker).vote(YEA_VOTE).send()
+        # the vote value is checked after the period
+        with self.raisesMichelsonError(NOT_PROMOTION_PERIOD):
+            governance.using(baker).vote('yep').send()
 
 
     def test_should_fail_if_vote_parameter_is_incorrect(self) -> None:
@@ -94,6 +97,8 @@ class KernelGovernanceNewProposalTestCase(BaseTestCase):
 
         with self.raisesMichelsonError(PROMOTION_ALREADY_VOTED):
             governance.using(baker).vote(YEA_VOTE).send()
+        with self.raisesMichelsonError(PROMOTION_ALREADY_VOTED):
+            governance.using(baker).vote('yep').send()
 
     def test_should_vote_on_proposal_with_correct_parameters(self) -> None:
         baker1 = self.bootstrap_baker()
@@ -0,0 +1,89 @@
+from pytezos.client import PyTezosClient
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import PROMOTION_PERIOD, PROPOSAL_PERIOD, YEA_VOTE
+from tests.helpers.contracts.multi_track_kernel_governance import REGULAR_TRACK, SECURITY_TRACK
+from tests.helpers.errors import TRACK_NOT_FOUND, UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED
+from tests.helpers.indexer import decode_event_payload
+from tests.helpers.utility import find_op_by_hash, get_events_from_op
+import re
+
+class MultiTrackKernelGovernanceTracksTestCase(BaseTestCase):
+    def test_should_fail_if_track_is_not_found(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_multi_track_kernel_governance()
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        with self.raisesMichelsonError(TRACK_NOT_FOUND):
+            governance.using(baker).new_proposal('unknown', kernel_root_hash).send()
+
+    def test_should_emit_events_with_track(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_multi_track_kernel_governance()
+
+        kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        opg = governance.using(baker).new_proposal(SECURITY_TRACK, kernel_root_hash).send()
+        self.bake_block()
+
+        events = get_events_from_op(find_op_by_hash(self.manager, opg))
+        assert [event['tag'] for event in events] == ['period_started', 'new_proposal']
+        payloads = [decode_event_payload(event) for event in events]
+        assert [payload['track'] for payload in payloads] == [SECURITY_TRACK, SECURITY_TRACK]
+        assert payloads[1]['event']['payload'] == kernel_root_hash
+
+    def test_should_keep_metadata_only_in_contract(self) -> None:
+        governance = self.deploy_multi_track_kernel_governance()
+
+        storage = governance.get_storage()
+        assert storage.tracks[REGULAR_TRACK].metadata == None
+        assert storage.tracks[SECURITY_TRACK].metadata == None
+        assert storage.metadata != None
+
+    def test_should_vote_in_tracks_independently(self) -> None:
+        baker = self.bootstrap_baker()
+        security_baker = self.bootstrap_baker()
+        rollup_mock = self.deploy_rollup_mock()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 0 counted from started_at_level
+        governance = self.deploy_multi_track_kernel_governance(custom_configs={
+            REGULAR_TRACK: {
+                'started_at_level': governance_started_at_level,
+                'period_length': 2,
+                'proposal_quorum': 20,
+                'promotion_quorum': 20,
+                'promotion_supermajority': 20,
+            },
+            SECURITY_TRACK: {
+                'started_at_level': governance_started_at_level,
+                'period_length': 4,
+                'proposal_quorum': 20,
+            },
+        })
+
+        regular_kernel_root_hash = bytes.fromhex('010101010101010101010101010101010101010101010101010101010101010101')
+        security_kernel_root_hash = bytes.fromhex('020202020202020202020202020202020202020202020202020202020202020202')
+        # Period index: 0. Block: 1 counted from started_at_level
+        governance.using(baker).new_proposal(REGULAR_TRACK, regular_kernel_root_hash).send()
+        governance.using(security_baker).new_proposal(SECURITY_TRACK, security_kernel_root_hash).send()
+        self.bake_blocks(2)
+
+        # Block: 3 counted from started_at_level. Regular period index: 1. Security period index: 0
+        assert governance.get_voting_state(REGULAR_TRACK)['period_type'] == PROMOTION_PERIOD
+        assert governance.get_voting_state(SECURITY_TRACK)['period_type'] == PROPOSAL_PERIOD
+        governance.using(baker).vote(REGULAR_TRACK, YEA_VOTE).send()
+        self.bake_blocks(2)
+
+        assert governance.get_last_winner(REGULAR_TRACK) == regular_kernel_root_hash
+        assert governance.get_last_winner(SECURITY_TRACK) == None
+
+        storage = governance.contract.storage()
+        assert storage['tracks'][REGULAR_TRACK]['voting_context']['period_index'] == 1
+        assert storage['tracks'][SECURITY_TRACK]['voting_context']['period_index'] == 0
+
+        payload_pattern = rf'^EBA1{regular_kernel_root_hash.hex()}88[\da-f]{{16}}$'
+        governance.using(baker).trigger_kernel_upgrade(REGULAR_TRACK, rollup_mock.contract.address).send()
+        self.bake_block()
+        assert re.match(payload_pattern, rollup_mock.contract.storage().hex(), re.IGNORECASE)
+
+        with self.raisesMichelsonError(UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED):
+            governance.using(baker).trigger_kernel_upgrade(REGULAR_TRACK, rollup_mock.contract.address).send()
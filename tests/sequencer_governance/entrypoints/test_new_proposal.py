@@ -157,6 +157,40 @@ class CommitteeGovernanceNewProposalTestCase(BaseTestCase):
         with self.raisesMichelsonError(PROPOSAL_ALREADY_CREATED):
             governance.using(baker).new_proposal(payload['sequencer_pk'], payload['pool_address']).send()
 
+    def test_should_store_proposal_by_payload_hash(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 5
+        governance = self.deploy_sequencer_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 5,
+        })
+
+        payload = {
+            'sequencer_pk': 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X',
+            'pool_address': 'B7A97043983f24991398E5a82f63F4C58a417185'
+        }
+        proposal_key = governance.get_proposal_key(payload['sequencer_pk'], payload['pool_address'])
+        assert len(proposal_key) == 32
+
+        # Period index: 0. Block: 2 of 5
+        governance.using(baker1).new_proposal(payload['sequencer_pk'], payload['pool_address']).send()
+        self.bake_block()
+        # Period index: 0. Block: 3 of 5
+        governance.using(baker2).upvote_proposal(payload['sequencer_pk'], payload['pool_address']).send()
+        self.bake_block()
+
+        storage = governance.contract.storage
+        assert storage['payloads'][proposal_key]() == pack_sequencer_payload(payload)
+        assert storage['proposals'][(0, proposal_key)]() == {
+            'proposer': pkh(baker1),
+            'upvotes_voting_power': DEFAULT_VOTING_POWER * 2,
+        }
+        assert storage['upvoters_proposals'][(0, pkh(baker1))]() == [proposal_key]
+        assert storage['upvoters_proposals'][(0, pkh(baker2))]() == [proposal_key]
+
     def test_should_create_new_proposal_with_correct_parameters(self) -> None:
         baker1 = self.bootstrap_baker()
         baker2 = self.bootstrap_baker()
@@ -0,0 +1,82 @@
+from pytezos.client import PyTezosClient
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import YEA_VOTE
+from tests.helpers.contracts.sequencer_governance import SequencerGovernance
+from tests.helpers.errors import (
+    LAST_WINNER_NOT_FOUND,
+    NO_ROLLUPS_TO_UPGRADE,
+    UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED,
+    TEZ_IN_TRANSACTION_DISALLOWED
+)
+from tests.helpers.utility import DEFAULT_ADDRESS
+import re
+
+class CommitteeGovernanceTriggerCommitteeUpgradesTestCase(BaseTestCase):
+    def prepare_last_winner(self, sequencer_pk, pool_address):
+        baker = self.bootstrap_baker()
+        governance_started_at_level = self.get_current_level() + 1
+        governance = self.deploy_sequencer_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 2,
+            'proposal_quorum': 20,
+            'promotion_quorum': 20,
+            'promotion_supermajority': 20,
+        })
+
+        # Period index: 0. Block: 2 of 2
+        governance.using(baker).new_proposal(sequencer_pk, pool_address).send()
+        self.bake_blocks(2)
+
+        # Period index: 1. Block: 2 of 2
+        governance.using(baker).vote(YEA_VOTE).send()
+        self.bake_blocks(2)
+
+        return {
+            'governance': governance,
+            'baker': baker,
+        }
+
+    def test_should_fail_if_tez_in_transaction(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_sequencer_governance()
+
+        with self.raisesMichelsonError(TEZ_IN_TRANSACTION_DISALLOWED):
+            governance.using(baker).trigger_committee_upgrades([DEFAULT_ADDRESS]).with_amount(1).send()
+
+    def test_should_fail_if_there_is_no_last_winner_payload(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_sequencer_governance()
+
+        with self.raisesMichelsonError(LAST_WINNER_NOT_FOUND):
+            governance.using(baker).trigger_committee_upgrades([DEFAULT_ADDRESS]).send()
+
+    def test_should_fail_if_rollup_addresses_set_is_empty(self) -> None:
+        sequencer_pk = 'edpkuBknW28nW72KG6RoHtYW7p12T6GKc7nAbwYX5m8Wd9sDVC9yav'
+        pool_address = '71c7656ec7ab88b098defb751b7401b5f6d8976f'
+        test = self.prepare_last_winner(sequencer_pk, pool_address)
+        governance : SequencerGovernance = test['governance']
+        baker : PyTezosClient = test['baker']
+
+        with self.raisesMichelsonError(NO_ROLLUPS_TO_UPGRADE):
+            governance.using(baker).trigger_committee_upgrades([]).send()
+
+    def test_should_send_last_winner_payload_to_all_rollups(self) -> None:
+        rollup_mocks = [self.deploy_rollup_mock() for _ in range(3)]
+        sequencer_pk = 'edpkuBknW28nW72KG6RoHtYW7p12T6GKc7nAbwYX5m8Wd9sDVC9yav'
+        pool_address = '71c7656ec7ab88b098defb751b7401b5f6d8976f'
+        test = self.prepare_last_winner(sequencer_pk, pool_address)
+        governance : SequencerGovernance = test['governance']
+        baker : PyTezosClient = test['baker']
+
+        payload_pattern = rf'^F855B6{sequencer_pk.encode().hex()}94{pool_address}88[\da-f]{{16}}$'
+        governance.using(baker).trigger_committee_upgrades([rollup_mock.contract.address for rollup_mock in rollup_mocks]).send()
+        self.bake_block()
+
+        payloads = [rollup_mock.contract.storage().hex() for rollup_mock in rollup_mocks]
+        for payload in payloads:
+            assert re.match(payload_pattern, payload, re.IGNORECASE)
+        assert len(set(payloads)) == 1
+        assert governance.contract.storage()['last_winner']['payload_prefix'] == bytes.fromhex(payloads[0])[:-8]
+
+        with self.raisesMichelsonError(UPGRADE_FOR_ADDRESS_ALREADY_TRIGGERED):
+            governance.using(baker).trigger_committee_upgrades([rollup_mocks[0].contract.address]).send()
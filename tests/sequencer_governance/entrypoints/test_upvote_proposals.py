@@ -0,0 +1,124 @@
+from tests.base import BaseTestCase
+from tests.helpers.contracts.governance_base import PROPOSAL_PERIOD
+from tests.helpers.errors import (
+    NO_PROPOSALS_TO_UPVOTE, NO_VOTING_POWER, PROPOSAL_ALREADY_UPVOTED, PROPOSAL_NOT_FOUND, UPVOTING_LIMIT_EXCEEDED, 
+    TEZ_IN_TRANSACTION_DISALLOWED
+)
+from tests.helpers.utility import DEFAULT_TOTAL_VOTING_POWER, DEFAULT_VOTING_POWER, pack_sequencer_payload
+
+class CommitteeGovernanceUpvoteProposalsTestCase(BaseTestCase):
+    def test_should_fail_if_tez_in_transaction(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_sequencer_governance()
+        
+        payload = {
+            'sequencer_pk': 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X',
+            'pool_address': 'B7A97043983f24991398E5a82f63F4C58a417185'
+        }
+        with self.raisesMichelsonError(TEZ_IN_TRANSACTION_DISALLOWED):
+            governance.using(baker).upvote_proposals([payload]).with_amount(1).send()
+
+    def test_should_fail_if_sender_has_no_voting_power(self) -> None:
+        no_baker = self.bootstrap_no_baker()
+        governance = self.deploy_sequencer_governance()
+
+        payload = {
+            'sequencer_pk': 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X',
+            'pool_address': 'B7A97043983f24991398E5a82f63F4C58a417185'
+        }
+        with self.raisesMichelsonError(NO_VOTING_POWER):
+            governance.using(no_baker).upvote_proposals([payload]).send()
+
+    def test_should_fail_if_proposals_list_is_empty(self) -> None:
+        baker = self.bootstrap_baker()
+        governance = self.deploy_sequencer_governance()
+
+        with self.raisesMichelsonError(NO_PROPOSALS_TO_UPVOTE):
+            governance.using(baker).upvote_proposals([]).send()
+
+    def test_should_fail_if_one_of_proposals_is_not_found(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        governance = self.deploy_sequencer_governance()
+
+        payload1 = {
+            'sequencer_pk': 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X',
+            'pool_address': 'B7A97043983f24991398E5a82f63F4C58a417185'
+        }
+        payload2 = {
+            'sequencer_pk': 'edpktzB3sirfeX6PrgAgWvRVT8Fd28jVLbWXKJmaUrYzgkzKSWQnxC',
+            'pool_address': 'B7A97043983f24991398E5a82f63F4C58a417185'
+        }
+        governance.using(baker1).new_proposal(payload1['sequencer_pk'], payload1['pool_address']).send()
+        self.bake_block()
+
+        with self.raisesMichelsonError(PROPOSAL_NOT_FOUND):
+            governance.using(baker2).upvote_proposals([payload1, payload2]).send()
+
+    def test_should_fail_if_proposal_is_repeated_in_batch(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        governance = self.deploy_sequencer_governance()
+
+        payload = {
+            'sequencer_pk': 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X',
+            'pool_address': 'B7A97043983f24991398E5a82f63F4C58a417185'
+        }
+        governance.using(baker1).new_proposal(payload['sequencer_pk'], payload['pool_address']).send()
+        self.bake_block()
+
+        with self.raisesMichelsonError(PROPOSAL_ALREADY_UPVOTED):
+            governance.using(baker2).upvote_proposals([payload, payload]).send()
+
+    def test_should_upvote_proposals_with_correct_parameters(self) -> None:
+        baker1 = self.bootstrap_baker()
+        baker2 = self.bootstrap_baker()
+        baker3 = self.bootstrap_baker()
+        # deploying will take 1 block
+        governance_started_at_level = self.get_current_level() + 1
+        # Period index: 0. Block: 1 of 5
+        governance = self.deploy_sequencer_governance(custom_config={
+            'started_at_level': governance_started_at_level,
+            'period_length': 5,
+            'upvoting_limit': 2
+        })
+
+        payload1 = {
+            'sequencer_pk': 'edpkurcgafZ2URyB6zsm5d1YqmLt9r1Lk89J81N6KpyMaUzXWEsv1X',
+            'pool_address': 'B7A97043983f24991398E5a82f63F4C58a417185'
+        }
+        payload2 = {
+            'sequencer_pk': 'edpktzB3sirfeX6PrgAgWvRVT8Fd28jVLbWXKJmaUrYzgkzKSWQnxC',
+            'pool_address': 'B7A97043983f24991398E5a82f63F4C58a417185'
+        }
+        # Period index: 0. Block: 2 of 5
+        governance.using(baker1).new_proposal(payload1['sequencer_pk'], payload1['pool_address']).send()
+        governance.using(baker2).new_proposal(payload2['sequencer_pk'], payload2['pool_address']).send()
+        self.bake_block()
+
+        # Period index: 0. Block: 3 of 5
+        governance.using(baker3).upvote_proposals([payload1, payload2]).send()
+        self.bake_block()
+
+        storage = governance.contract.storage()
+        assert storage['voting_context']['period_index'] == 0
+        assert storage['voting_context']['period']['proposal']['winner_candidate'] == None
+        assert storage['voting_context']['period']['proposal']['max_upvotes_voting_power'] == DEFAULT_VOTING_POWER * 2
+        assert storage['voting_context']['period']['proposal']['total_voting_power'] == DEFAULT_TOTAL_VOTING_POWER
+        assert governance.get_voting_state() == {
+            'period_type': PROPOSAL_PERIOD,
+            'period_index': 0,
+            'remaining_blocks': 3,
+            'finished_voting': None
+        }
+
+        # Period index: 0. Block: 4 of 5
+        governance.using(baker1).upvote_proposals([payload2]).send()
+        self.bake_block()
+
+        storage = governance.contract.storage()
+        assert storage['voting_context']['period']['proposal']['winner_candidate'] == pack_sequencer_payload(payload2)
+        assert storage['voting_context']['period']['proposal']['max_upvotes_voting_power'] == DEFAULT_VOTING_POWER * 3
+        key1 = governance.get_proposal_key(payload1['sequencer_pk'], payload1['pool_address'])
+        key2 = governance.get_proposal_key(payload2['sequencer_pk'], payload2['pool_address'])
+        assert sorted(storage['upvoters_proposals'][(0, baker3.key.public_key_hash())]()) == sorted([key1, key2])